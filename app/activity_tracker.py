@@ -5,13 +5,17 @@ Privacy-preserving: tracks counts only, no message content.
 Thread-safe JSON persistence with 90-day retention.
 """
 
+import heapq
 import json
 import os
 import threading
 import time
 from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Set
+from operator import itemgetter
+from typing import Dict, Any, Optional, List, Set, Tuple
+
+from persistence import atomic_json_write, read_json
 
 
 class ActivityTracker:
@@ -32,20 +36,16 @@ class ActivityTracker:
     def _load(self) -> Dict[str, Any]:
         if os.path.exists(self._path):
             try:
-                with open(self._path, "r") as f:
-                    data = json.load(f)
-                    # Migration: ensure all expected fields exist
-                    return self._migrate(data)
+                data = read_json(self._path)
+                # Migration: ensure all expected fields exist
+                return self._migrate(data)
             except (json.JSONDecodeError, IOError) as e:
                 print(f"[ActivityTracker] Error loading {self._path}: {e}")
         return self._default_data()
 
     def _save(self):
         try:
-            tmp = self._path + ".tmp"
-            with open(tmp, "w") as f:
-                json.dump(self._data, f, indent=2)
-            os.replace(tmp, self._path)
+            atomic_json_write(self._path, self._data, indent=2)
         except IOError as e:
             print(f"[ActivityTracker] Error saving: {e}")
 
@@ -266,13 +266,15 @@ class ActivityTracker:
 
     def get_weekly_trend(self) -> List[Dict[str, Any]]:
         """Get daily stats for the last 7 days."""
+        now = datetime.utcnow()
         with self._lock:
             result = []
             for i in range(6, -1, -1):
-                date = (datetime.utcnow() - timedelta(days=i)).strftime("%Y-%m-%d")
+                date = (now - timedelta(days=i)).strftime("%Y-%m-%d")
                 day = self._data["daily"].get(date, self._empty_day())
                 result.append({
                     "date": date,
+                    "short_date": date[5:],  # MM-DD
                     "messages": day["messages"],
                     "unique_users": len(day["unique_users"]),
                     "commands": day["commands"],
@@ -281,8 +283,11 @@ class ActivityTracker:
 
     def get_sparkline(self, days: int = 7) -> str:
         """Generate a text sparkline of message activity."""
+        return self._sparkline(self.get_weekly_trend(), days)
+
+    @staticmethod
+    def _sparkline(trend: List[Dict[str, Any]], days: int) -> str:
         bars = "▁▂▃▄▅▆▇█"
-        trend = self.get_weekly_trend()
         values = [d["messages"] for d in trend[-days:]]
 
         if not values or max(values) == 0:
@@ -312,18 +317,32 @@ class ActivityTracker:
             return 0.0
         return sum(self._response_times) / len(self._response_times)
 
-    def get_command_leaderboard(self, days: int = 30) -> Dict[str, int]:
-        """Get command usage over the specified period."""
+    def get_top_commands(self, days: int = 30, n: int = 8) -> Tuple[List[tuple], int]:
+        """Get the n most used commands over the period and the period's command total."""
         cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
 
         with self._lock:
             totals: Dict[str, int] = defaultdict(int)
+            total = 0
             for date, day in self._data["daily"].items():
                 if date >= cutoff:
                     for cmd, count in day.get("command_counts", {}).items():
                         totals[cmd] += count
+                        total += count
 
-            return dict(sorted(totals.items(), key=lambda x: x[1], reverse=True))
+        return heapq.nlargest(n, totals.items(), key=itemgetter(1)), total
+
+    def get_all_stats(self) -> Dict[str, Any]:
+        """Get every dashboard stat at once, each computed a single time."""
+        trend = self.get_weekly_trend()
+        return {
+            "summary_24h": self.get_24h_summary(),
+            "peak_hours": self.get_peak_hours(),
+            "weekly_trend": trend,
+            "sparkline": self._sparkline(trend, 7),
+            "avg_response_time": self.get_avg_response_time(),
+            "top_commands": self.get_top_commands(30, 8),
+        }
 
     @staticmethod
     def _top_n(d: Dict[str, int], n: int) -> List[tuple]:
@@ -4,6 +4,7 @@ Admin Manager for Seedkeeper
 Handles bot administration and permissions
 """
 
+import asyncio
 import json
 import os
 from pathlib import Path
@@ -12,6 +13,9 @@ import discord
 from discord.ext import commands
 from persistence import atomic_json_write
 
+# Reactions accepted on a broadcast confirmation prompt
+CONFIRM_EMOJI = frozenset(("✅", "❌"))
+
 class AdminManager:
     """Manages admin users and permissions for the bot"""
     
@@ -71,9 +75,9 @@ class AdminManager:
         """Save configuration to file"""
         atomic_json_write(self.config_file, self.config, indent=2)
     
-    def is_admin(self, user_id: str) -> bool:
-        """Check if a user is an admin"""
-        return user_id in self.admins
+    def is_admin(self, user_id) -> bool:
+        """Check if a user is an admin (set lookup; accepts int or str ids)"""
+        return str(user_id) in self.admins
     
     def add_admin(self, user_id: str) -> bool:
         """Add a user as admin"""
@@ -108,12 +112,21 @@ class AdminManager:
         return self.config.get(key, default)
 
 
+async def _application_owner_id(bot) -> int:
+    """Return the application owner's id, fetching application info only once"""
+    owner_id = getattr(bot, '_application_owner_id', None)
+    if owner_id is None:
+        app_info = await bot.application_info()
+        owner_id = bot._application_owner_id = app_info.owner.id
+    return owner_id
+
+
 def is_admin():
     """Discord.py check decorator for admin-only commands"""
     async def predicate(ctx):
-        # Check if user is bot owner (always admin)
-        app_info = await ctx.bot.application_info()
-        if ctx.author.id == app_info.owner.id:
+        # Check if user is bot owner (always admin). Only the single owner, not
+        # every member of an owning team as bot.is_owner() would allow.
+        if ctx.author.id == await _application_owner_id(ctx.bot):
             return True
         
         # Check if user is in admin list
@@ -416,10 +429,13 @@ class AdminCommands(commands.Cog):
         await confirm_msg.add_reaction("✅")
         await confirm_msg.add_reaction("❌")
         
+        author_id = ctx.author.id
+        confirm_id = confirm_msg.id
+
         def check(reaction, user):
-            return (user == ctx.author and 
-                   str(reaction.emoji) in ["✅", "❌"] and
-                   reaction.message.id == confirm_msg.id)
+            return (user.id == author_id and
+                   reaction.message.id == confirm_id and
+                   str(reaction.emoji) in CONFIRM_EMOJI)
         
         try:
             reaction, user = await self.bot.wait_for('reaction_add', timeout=30.0, check=check)
@@ -5,6 +5,7 @@ Single source of truth for routing and help text.
 """
 
 from difflib import get_close_matches
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 
@@ -185,8 +186,9 @@ def get_user_commands(is_admin: bool = False) -> Dict[str, List[CommandInfo]]:
     return categories
 
 
+@lru_cache(maxsize=2)
 def format_commands_text(is_admin: bool = False) -> str:
-    """Generate the !commands help text from the registry."""
+    """Generate the !commands help text from the registry (cached per is_admin)."""
     categories = get_user_commands(is_admin)
     category_order = ["General", "Conversation", "Feedback", "Memory", "Birthday", "Admin"]
 
@@ -206,8 +208,9 @@ def format_commands_text(is_admin: bool = False) -> str:
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=1)
 def generate_commands_reference() -> str:
-    """Generate a plain text reference for the system prompt."""
+    """Generate a plain text reference for the system prompt (cached; the registry is static)."""
     lines = ["Your commands (all start with !):"]
     admin_cmds = []
     for cmd in sorted(COMMANDS.values(), key=lambda c: c.name):
@@ -16,6 +16,17 @@ CONVERSATION_STORAGE_LIMIT = 30
 # Persistent memories to retrieve from disk
 PERSISTENT_MEMORY_LIMIT = 10
 
+# Once a DM session holds this many messages, the turns outside the last
+# CONVERSATION_HISTORY_LIMIT are folded into a running summary (must stay
+# above CONVERSATION_HISTORY_LIMIT and below CONVERSATION_STORAGE_LIMIT)
+DM_SUMMARY_THRESHOLD = 20
+
+# Token budget for the running DM summary
+DM_SUMMARY_MAX_TOKENS = 120
+
+# DM conversations handled at once across all users (each holds an LLM call)
+DM_MAX_CONCURRENT = 8
+
 
 # ── Response Settings ───────────────────────────────────────────────
 
@@ -25,6 +36,9 @@ DEFAULT_MAX_TOKENS = 800
 # Max message length before splitting (Discord limit is 2000)
 MAX_MESSAGE_LENGTH = 2000
 
+# DM channels kept resolved in memory (least recently used are dropped)
+DM_CHANNEL_CACHE_SIZE = 1000
+
 
 # ── Birthday Settings ───────────────────────────────────────────────
 
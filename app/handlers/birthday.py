@@ -2,11 +2,13 @@
 
 import os
 import re
+import discord
 from collections import defaultdict
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
 from typing import Dict, Any, List, Optional, Tuple
 
+from input_validator import InputValidator
 from zodiac import format_sign_display, get_western_zodiac, get_chinese_zodiac
 
 
@@ -19,6 +21,10 @@ MONTH_NAMES = {
     'october': 10, 'oct': 10, 'november': 11, 'nov': 11, 'december': 12, 'dec': 12,
 }
 
+# User mention (<@id> / <@!id>) and raw Discord user ID
+USER_MENTION_RE = re.compile(r'<@!?(\d+)>')
+SNOWFLAKE_RE = re.compile(r'^\d{17,20}$')
+
 
 def _normalize_year(y: int) -> int:
     """Convert 2-digit year to 4-digit: 0-29 → 2000s, 30-99 → 1900s."""
@@ -193,6 +199,24 @@ class BirthdayHandler:
     def __init__(self, bot):
         self.bot = bot
 
+        # Subcommand dispatch: name -> (handler, minimum number of args).
+        # Every handler takes (args, author_id, channel_id, is_dm, guild_id).
+        self._subcommands = {
+            'mine': (self._handle_mine, 2),
+            'year': (self._handle_year, 2),
+            'ask-years': (self._handle_ask_years, 1),
+            'announce': (self._handle_announce, 2),
+            'remove': (self._handle_remove, 1),
+            'upcoming': (self._handle_upcoming, 1),
+            'parse': (self._handle_parse, 2),
+            'match': (self._handle_match, 1),
+            'confirm': (self._handle_confirm, 1),
+            'add': (self._handle_add, 3),
+            'set': (self._handle_set, 3),
+            'scan': (self._handle_scan, 1),
+            'list': (self._handle_list, 1),
+        }
+
     async def handle_sign_command(self, command_data: Dict[str, Any]):
         """Handle !sign command - show zodiac signs."""
         args = command_data.get('args', '').strip()
@@ -206,7 +230,7 @@ class BirthdayHandler:
 
         if args:
             # Check for @mention
-            mention_match = re.match(r'<@!?(\d+)>', args)
+            mention_match = USER_MENTION_RE.match(args)
             if mention_match:
                 target_id = mention_match.group(1)
 
@@ -288,37 +312,16 @@ class BirthdayHandler:
 
         subcommand = args[0].lower()
 
-        if subcommand == 'mine' and len(args) >= 2:
-            await self._handle_mine(args, author_id, channel_id, is_dm)
-        elif subcommand == 'year' and len(args) >= 2:
-            await self._handle_year(args, author_id, channel_id, is_dm)
-        elif subcommand == 'ask-years':
-            await self._handle_ask_years(author_id, channel_id, is_dm)
-        elif subcommand == 'announce' and len(args) >= 2:
-            await self._handle_announce(args, author_id, channel_id, is_dm)
-        elif subcommand == 'remove':
-            await self._handle_remove(args, author_id, channel_id, is_dm)
-        elif subcommand == 'upcoming':
-            await self._handle_upcoming(args, author_id, channel_id, is_dm)
-        elif subcommand == 'parse' and len(args) >= 2:
-            await self._handle_parse(args, author_id, channel_id, is_dm)
-        elif subcommand == 'match':
-            await self._handle_match(author_id, channel_id, is_dm, guild_id)
-        elif subcommand == 'confirm':
-            await self._handle_confirm(author_id, channel_id, is_dm)
-        elif subcommand == 'add' and len(args) >= 3:
-            await self._handle_add(args, author_id, channel_id, is_dm, guild_id)
-        elif subcommand == 'set' and len(args) >= 3:
-            await self._handle_set(args, author_id, channel_id, is_dm)
-        elif subcommand == 'scan':
-            await self._handle_scan(author_id, channel_id, is_dm, args=args, guild_id=guild_id)
-        elif subcommand == 'list':
-            await self._handle_list(args, author_id, channel_id, is_dm)
-        else:
+        entry = self._subcommands.get(subcommand)
+        if entry is None or len(args) < entry[1]:
             await self.bot.send_message(channel_id,
                 "Use `!birthday` to see available commands.", is_dm=is_dm, author_id=str(author_id))
+            return
+
+        handler, _ = entry
+        await handler(args, author_id, channel_id, is_dm, guild_id)
 
-    async def _handle_mine(self, args, author_id, channel_id, is_dm):
+    async def _handle_mine(self, args, author_id, channel_id, is_dm, guild_id):
         birthday_str = ' '.join(args[1:])
         try:
             month, day, year = parse_date_input(birthday_str)
@@ -339,13 +342,12 @@ class BirthdayHandler:
             await self.bot.send_message(channel_id,
                 f"❌ {e}", is_dm=is_dm, author_id=str(author_id))
 
-    async def _handle_year(self, args, author_id, channel_id, is_dm):
+    async def _handle_year(self, args, author_id, channel_id, is_dm, guild_id):
         """Handle !birthday year YYYY - add birth year to existing birthday."""
         try:
             year = int(args[1])
             success, message = self.bot.birthday_manager.set_year(str(author_id), year)
             if success:
-                from zodiac import get_chinese_zodiac
                 chinese = get_chinese_zodiac(year)
                 await self.bot.send_message(channel_id,
                     f"🎂 Birth year set to {year}! You're a {chinese['emoji']} {chinese['animal']}!",
@@ -357,7 +359,7 @@ class BirthdayHandler:
                 "❌ Please provide a valid year (e.g., `!birthday year 1990`)",
                 is_dm=is_dm, author_id=str(author_id))
 
-    async def _handle_ask_years(self, author_id, channel_id, is_dm):
+    async def _handle_ask_years(self, args, author_id, channel_id, is_dm, guild_id):
         """Handle !birthday ask-years - post announcement asking users to share birthday info."""
         if not self.bot.admin_manager.is_admin(str(author_id)):
             await self.bot.send_message(channel_id,
@@ -420,7 +422,7 @@ class BirthdayHandler:
 
         await self.bot.send_message(channel_id, announcement, is_dm=is_dm, author_id=str(author_id))
 
-    async def _handle_announce(self, args, author_id, channel_id, is_dm):
+    async def _handle_announce(self, args, author_id, channel_id, is_dm, guild_id):
         """Handle !birthday announce @user - manually trigger a birthday announcement (admin only)."""
         if not self.bot.admin_manager.is_admin(str(author_id)):
             await self.bot.send_message(channel_id,
@@ -429,10 +431,10 @@ class BirthdayHandler:
 
         # Parse user mention or ID
         user_arg = args[1]
-        user_match = re.match(r'<@!?(\d+)>', user_arg)
+        user_match = USER_MENTION_RE.match(user_arg)
         if user_match:
             target_user_id = user_match.group(1)
-        elif re.match(r'^\d{17,20}$', user_arg):
+        elif SNOWFLAKE_RE.match(user_arg):
             target_user_id = user_arg
         else:
             await self.bot.send_message(channel_id,
@@ -477,10 +479,10 @@ class BirthdayHandler:
                 f"❌ Error posting announcement: {e}",
                 is_dm=is_dm, author_id=str(author_id))
 
-    async def _handle_remove(self, args, author_id, channel_id, is_dm):
+    async def _handle_remove(self, args, author_id, channel_id, is_dm, guild_id):
         if len(args) >= 2:
             user_mention = args[1]
-            user_match = re.match(r'<@!?(\d+)>', user_mention)
+            user_match = USER_MENTION_RE.match(user_mention)
             target_id = user_match.group(1) if user_match else str(author_id)
             success, message = self.bot.birthday_manager.remove_birthday(target_id)
             msg = "🎂 Birthday removed!" if success else f"❌ {message}"
@@ -489,7 +491,7 @@ class BirthdayHandler:
             msg = "🎂 Your birthday has been removed." if success else f"❌ {message}"
         await self.bot.send_message(channel_id, msg, is_dm=is_dm, author_id=str(author_id))
 
-    async def _handle_upcoming(self, args, author_id, channel_id, is_dm):
+    async def _handle_upcoming(self, args, author_id, channel_id, is_dm, guild_id):
         days = 7
         if len(args) > 1:
             try:
@@ -511,7 +513,7 @@ class BirthdayHandler:
             text = f"No upcoming birthdays in the next {days} days! 🌱"
         await self.bot.send_message(channel_id, text, is_dm=is_dm, author_id=str(author_id))
 
-    async def _handle_parse(self, args, author_id, channel_id, is_dm):
+    async def _handle_parse(self, args, author_id, channel_id, is_dm, guild_id):
         if not self.bot.admin_manager.is_admin(str(author_id)):
             await self.bot.send_message(channel_id,
                 "🚫 Only Garden Keepers can parse birthdays.", is_dm=is_dm, author_id=str(author_id))
@@ -541,7 +543,7 @@ class BirthdayHandler:
                 "❌ Could not parse any birthdays from that text.",
                 is_dm=is_dm, author_id=str(author_id))
 
-    async def _handle_match(self, author_id, channel_id, is_dm, guild_id):
+    async def _handle_match(self, args, author_id, channel_id, is_dm, guild_id):
         if not self.bot.admin_manager.is_admin(str(author_id)):
             await self.bot.send_message(channel_id,
                 "Only Garden Keepers can match birthdays.", is_dm=is_dm, author_id=str(author_id))
@@ -618,7 +620,7 @@ class BirthdayHandler:
         response += "\n`!birthday confirm` to save matched birthdays."
         await self.bot.send_message(channel_id, response, is_dm=is_dm, author_id=str(author_id))
 
-    async def _handle_confirm(self, author_id, channel_id, is_dm):
+    async def _handle_confirm(self, args, author_id, channel_id, is_dm, guild_id):
         if not self.bot.admin_manager.is_admin(str(author_id)):
             await self.bot.send_message(channel_id,
                 "Only Garden Keepers can confirm birthday additions.",
@@ -741,7 +743,7 @@ class BirthdayHandler:
                 f"❌ {e}",
                 is_dm=is_dm, author_id=str(author_id))
 
-    async def _handle_set(self, args, author_id, channel_id, is_dm):
+    async def _handle_set(self, args, author_id, channel_id, is_dm, guild_id):
         if not self.bot.admin_manager.is_admin(str(author_id)):
             await self.bot.send_message(channel_id,
                 "🚫 Only Garden Keepers can set others' birthdays.",
@@ -752,10 +754,10 @@ class BirthdayHandler:
         birthday_str = ' '.join(args[2:])
 
         # Support both @mention and raw user ID (17-20 digit Discord snowflake)
-        user_match = re.match(r'<@!?(\d+)>', user_arg)
+        user_match = USER_MENTION_RE.match(user_arg)
         if user_match:
             target_user_id = user_match.group(1)
-        elif re.match(r'^\d{17,20}$', user_arg):
+        elif SNOWFLAKE_RE.match(user_arg):
             # Raw Discord user ID (snowflake format)
             target_user_id = user_arg
         else:
@@ -788,7 +790,7 @@ class BirthdayHandler:
                 f"❌ {e}",
                 is_dm=is_dm, author_id=str(author_id))
 
-    async def _handle_scan(self, author_id, channel_id, is_dm, args=None, guild_id=None):
+    async def _handle_scan(self, args, author_id, channel_id, is_dm, guild_id):
         if not self.bot.admin_manager.is_admin(str(author_id)):
             await self.bot.send_message(channel_id,
                 "Only Garden Keepers can scan for birthdays.",
@@ -808,8 +810,7 @@ class BirthdayHandler:
         message_link = args[1]
 
         # Parse Discord message link
-        link_pattern = r'https://discord\.com/channels/(\d+)/(\d+)/(\d+)'
-        match = re.match(link_pattern, message_link)
+        match = InputValidator.DISCORD_LINK_PATTERN.match(message_link)
 
         if not match:
             await self.bot.send_message(channel_id,
@@ -831,7 +832,6 @@ class BirthdayHandler:
             is_dm=is_dm, author_id=str(author_id))
 
         try:
-            import discord
             target_channel = self.bot.get_channel(int(link_channel_id))
             if not target_channel:
                 await self.bot.send_message(channel_id,
@@ -914,7 +914,7 @@ class BirthdayHandler:
                 f"Error scanning channel: {e}",
                 is_dm=is_dm, author_id=str(author_id))
 
-    async def _handle_list(self, args, author_id, channel_id, is_dm):
+    async def _handle_list(self, args, author_id, channel_id, is_dm, guild_id):
         if len(args) > 1 and args[1].lower() == 'all':
             all_birthdays = self.bot.birthday_manager.get_all_birthdays()
             if all_birthdays:
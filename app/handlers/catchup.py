@@ -1,14 +1,54 @@
 """Catchup command handler: summarize missed conversations."""
 
 import os
-import re
+import time
 import discord
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict, deque
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+from input_validator import InputValidator
+
+# Chars of conversation text sent to the model for a summary
+CATCHUP_TEXT_LIMIT = 6000
+
+# Fixed instruction text for catchup summaries; kept identical across calls
+CATCHUP_INSTRUCTIONS = (
+    "Someone missed this conversation and wants to catch up.\n\n"
+    "Fill them in naturally - what happened, who said what, anything notable or important. "
+    "Be conversational, like you're telling a friend what they missed. Keep it digestible, "
+    "and don't use rigid headers or bullet points unless it really helps."
+)
 
 
 class CatchupHandler:
+    CACHE_TTL = 300   # seconds a summary is reused for the same link, focus and topic
+    CACHE_SIZE = 64   # max cached summaries
+
     def __init__(self, bot):
         self.bot = bot
+        # Max history messages fetched per catchup; read here, after the bot has
+        # loaded .env (this module is imported before that)
+        self._max_messages = int(os.getenv('MAX_MESSAGES', '500'))
+        # (link_channel_id, message_id, focus, channel_topic) -> (monotonic timestamp, summary)
+        self._catchup_cache = OrderedDict()
+
+    def _get_cached_summary(self, key: Tuple[str, str, str, str]) -> Optional[str]:
+        """Return a cached summary if it is still fresh"""
+        entry = self._catchup_cache.get(key)
+        if not entry:
+            return None
+        cached_at, summary = entry
+        if time.monotonic() - cached_at >= self.CACHE_TTL:
+            del self._catchup_cache[key]
+            return None
+        return summary
+
+    def _cache_summary(self, key: Tuple[str, str, str, str], summary: str):
+        """Store a summary, evicting the oldest entries past CACHE_SIZE"""
+        self._catchup_cache[key] = (time.monotonic(), summary)
+        self._catchup_cache.move_to_end(key)
+        while len(self._catchup_cache) > self.CACHE_SIZE:
+            self._catchup_cache.popitem(last=False)
 
     async def handle_catchup_command(self, command_data: Dict[str, Any]):
         """Handle !catchup command with message fetching."""
@@ -33,8 +73,7 @@ class CatchupHandler:
         focus = parts[1] if len(parts) > 1 else None
 
         # Parse Discord message link
-        link_pattern = r'https://discord\.com/channels/(\d+)/(\d+)/(\d+)'
-        match = re.match(link_pattern, message_link)
+        match = InputValidator.DISCORD_LINK_PATTERN.match(message_link)
 
         if not match:
             await self.bot.send_message(channel_id,
@@ -44,19 +83,9 @@ class CatchupHandler:
 
         link_guild_id, link_channel_id, message_id = match.groups()
 
-        # Security check: Ensure user is accessing their own guild
-        guild_id = command_data.get('guild_id')
-        if not is_dm and guild_id != link_guild_id:
-            await self.bot.send_message(channel_id,
-                "I can only catch you up on conversations from this server.",
-                is_dm=is_dm, author_id=author_id)
-            return
-
         # Validate and sanitize focus if provided
         if focus:
-            from input_validator import InputValidator
-            validator = InputValidator()
-            _, focus = validator.validate_focus_text(focus)
+            _, focus = InputValidator.validate_focus_text(focus)
             if len(focus) > 100:
                 focus = focus[:100]
 
@@ -66,6 +95,22 @@ class CatchupHandler:
             await self.bot.send_message(channel_id, rate_message, is_dm=is_dm, author_id=author_id)
             return
 
+        # Security check: Ensure user is accessing their own guild
+        guild_id = command_data.get('guild_id')
+        if not is_dm and guild_id != link_guild_id:
+            await self.bot.send_message(channel_id,
+                "I can only catch you up on conversations from this server.",
+                is_dm=is_dm, author_id=author_id)
+            return
+
+        # Same link + focus summarized recently (by anyone) under the same channel
+        # topic, which the prompt includes: resend it, skipping fetch + LLM
+        cache_key = (link_channel_id, message_id, focus or '', channel_topic or '')
+        cached_summary = self._get_cached_summary(cache_key)
+        if cached_summary:
+            await self.bot.send_message(channel_id, cached_summary, is_dm=is_dm, author_id=author_id)
+            return
+
         # Fetch messages directly from Discord
         try:
             target_channel = self.bot.get_channel(int(link_channel_id))
@@ -77,24 +122,32 @@ class CatchupHandler:
 
             await self.bot.send_typing(channel_id, is_dm=is_dm, author_id=author_id, duration=10)
 
-            messages = []
-            limit = int(os.getenv('MAX_MESSAGES', '500'))
-
-            async for msg in target_channel.history(limit=limit, after=discord.Object(id=int(message_id))):
-                if not (msg.author.bot and msg.author.id == self.bot.user.id):
-                    messages.append({
-                        'id': str(msg.id),
-                        'author': msg.author.name,
-                        'author_id': str(msg.author.id),
-                        'content': msg.content,
-                        'timestamp': msg.created_at.isoformat(),
-                        'attachments': len(msg.attachments),
-                        'embeds': len(msg.embeds)
-                    })
-
-            messages.reverse()
-
-            if not messages:
+            # Stream history into a bounded buffer of (author, content) pairs.
+            # History after a message arrives oldest-first, so dropping from the
+            # left keeps the newest CATCHUP_TEXT_LIMIT chars in reading order.
+            messages = deque()
+            buffered_len = 0
+            message_count = 0
+            earlier_omitted = False
+
+            self_id = self.bot.user.id
+            async for msg in target_channel.history(limit=self._max_messages, after=discord.Object(id=int(message_id))):
+                author = msg.author
+                if author.bot and author.id == self_id:
+                    continue
+                message_count += 1
+                content = msg.content
+                if not content:
+                    continue
+                name = author.name
+                messages.append((name, content))
+                buffered_len += len(name) + len(content) + 3
+                while buffered_len > CATCHUP_TEXT_LIMIT and len(messages) > 1:
+                    old_name, old_content = messages.popleft()
+                    buffered_len -= len(old_name) + len(old_content) + 3
+                    earlier_omitted = True
+
+            if not message_count:
                 await self.bot.send_message(channel_id,
                     "No messages since then - you're all caught up!",
                     is_dm=is_dm, author_id=author_id)
@@ -102,8 +155,9 @@ class CatchupHandler:
 
             # Generate summary
             summary = await self._generate_catchup_summary(
-                messages, focus=focus, channel_topic=channel_topic,
-                author_id=author_id, channel_id=channel_id
+                messages, message_count, earlier_omitted=earlier_omitted,
+                focus=focus, channel_topic=channel_topic,
+                author_id=author_id, channel_id=channel_id, cache_key=cache_key
             )
 
             await self.bot.send_message(channel_id, summary, is_dm=is_dm, author_id=author_id)
@@ -114,39 +168,33 @@ class CatchupHandler:
                 f"Something went wrong fetching those messages: {e}",
                 is_dm=is_dm, author_id=author_id)
 
-    async def _generate_catchup_summary(self, messages: List[Dict], focus: Optional[str] = None,
+    async def _generate_catchup_summary(self, messages: Iterable[Tuple[str, str]], message_count: int,
+                                        earlier_omitted: bool = False,
+                                        focus: Optional[str] = None,
                                         channel_topic: Optional[str] = None,
                                         author_id: Optional[str] = None,
-                                        channel_id: Optional[str] = None) -> str:
-        """Generate conversation summary."""
-        # Format messages for summary
-        conversation_text = ""
-        for msg in messages:
-            author = msg.get('author', 'Unknown')
-            content = msg.get('content', '')
-            if content:
-                conversation_text += f"{author}: {content}\n"
-
-        # Truncate if needed
-        if len(conversation_text) > 6000:
-            conversation_text = conversation_text[:6000] + "\n[...conversation continues...]"
-
-        channel_context = f"(Channel topic: {channel_topic})\n\n" if channel_topic else ""
-
+                                        channel_id: Optional[str] = None,
+                                        cache_key: Optional[Tuple[str, str, str, str]] = None) -> str:
+        """Generate conversation summary from (author, content) pairs.
+
+        Successful summaries are cached under cache_key; fallbacks are not.
+        """
+        conversation_text = "".join(f"{author}: {content}\n" for author, content in messages)
+
+        # A single oversized message can still exceed the cap
+        if len(conversation_text) > CATCHUP_TEXT_LIMIT:
+            conversation_text = conversation_text[-CATCHUP_TEXT_LIMIT:]
+            earlier_omitted = True
+        if earlier_omitted:
+            conversation_text = "[...earlier messages omitted...]\n" + conversation_text
+
+        # Static instructions lead so every catchup shares the same prompt prefix
+        # (lets Ollama reuse its KV cache); per-request context goes last.
+        prompt = f"{CATCHUP_INSTRUCTIONS}\n\nThe conversation:\n{conversation_text}"
         if focus:
-            prompt = f"""{channel_context}Someone missed this conversation and wants to catch up, especially about: {focus}
-
-Fill them in naturally - what happened, who said what, anything important. Be conversational, like you're telling a friend what they missed. Don't use rigid headers or bullet points unless it really helps.
-
-The conversation:
-{conversation_text}"""
-        else:
-            prompt = f"""{channel_context}Someone missed this conversation and wants to catch up.
-
-Fill them in naturally - what happened, who said what, anything notable or important. Be conversational, like you're telling a friend what they missed. Keep it digestible.
-
-The conversation:
-{conversation_text}"""
+            prompt += f"\n\nThey especially want to know about: {focus}"
+        if channel_topic:
+            prompt += f"\n\n(Channel topic: {channel_topic})"
 
         try:
             personality = self.bot.personality_manager.get_user_personality(str(author_id))
@@ -162,10 +210,13 @@ The conversation:
             self.bot._record_api_usage_from_result(result, "catchup",
                                                    user_id=author_id, channel_id=channel_id)
 
-            footer = f"\n\n*{len(messages)} messages*"
-            return result.text + footer
+            footer = f"\n\n*{message_count} messages*"
+            summary = result.text + footer
+            if cache_key:
+                self._cache_summary(cache_key, summary)
+            return summary
 
         except Exception as e:
             print(f"Error generating summary: {e}")
-            participants = set(msg.get('author', 'Unknown') for msg in messages if msg.get('content'))
-            return f"Couldn't generate a summary, but there were {len(messages)} messages from {', '.join(list(participants)[:5])}."
+            participants = set(author for author, _ in messages)
+            return f"Couldn't generate a summary, but there were {message_count} messages from {', '.join(list(participants)[:5])}."
@@ -4,36 +4,126 @@ import asyncio
 import os
 import re
 import random
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timezone
+from itertools import islice
 from typing import Dict, Any
 
 from input_validator import InputValidator
 from config import (
     CONVERSATION_HISTORY_LIMIT,
     CONVERSATION_STORAGE_LIMIT,
+    DM_MAX_CONCURRENT,
+    DM_SUMMARY_MAX_TOKENS,
+    DM_SUMMARY_THRESHOLD,
     PERSISTENT_MEMORY_LIMIT,
 )
 
+# Birthday-ish keywords; 'birth' also covers 'birthday', 'born' covers 'born on'
+BIRTHDAY_KEYWORDS_RE = re.compile(r'birth|born|bday|celebrate', re.IGNORECASE)
+# Shortest keyword ('born', 'bday'); shorter messages can't match
+BIRTHDAY_KEYWORD_MIN_LEN = 4
+
+# Neutral system prompt for DM summaries, so they aren't written in persona voice
+DM_SUMMARY_SYSTEM_PROMPT = "You write short, factual summaries of conversations."
+
+
+def _clip(text: str, limit: int = 500) -> str:
+    """Return text capped at limit chars, slicing only when it is actually longer."""
+    return text if len(text) <= limit else text[:limit]
+
+
+def _without_current(memories: list, content: str) -> list:
+    """Drop a trailing copy of the message being answered.
+
+    on_message saves the user's message before the handler runs, so a fresh
+    read usually ends with it; the prompt appends it explicitly instead.
+    """
+    if memories and memories[-1]['author'] == 'user' and memories[-1]['content'] == content:
+        return memories[:-1]
+    return memories
+
+
+def _with_system_prompt(personality: dict, system_prompt: str) -> dict:
+    """Return a copy of personality that uses system_prompt.
+
+    model_client prefers a personality's own system_prompt over the system
+    argument, so a per-call prompt has to be set on the personality.
+    """
+    return {**personality, 'system_prompt': system_prompt}
+
+
+def _tail(items: deque, n: int):
+    """Iterate over the last n items of a deque without copying it."""
+    return islice(items, max(0, len(items) - n), None)
+
 
 class ConversationHandler:
+    # Fixed fallback replies, shared across calls
+    DM_ERROR_REPLY = "I'm having trouble processing that right now, but I'm here!"
+    EMPTY_REPLY_FALLBACK = "I heard you, but my thoughts got tangled. Could you try again?"
+    MENTION_ERROR_REPLY = "Something went wrong: {error}. Try again in a moment?"
+
     def __init__(self, bot):
         self.bot = bot
+        self._mention_re = None  # compiled on first mention, once bot.user is known
+        self._summarizing = set()  # author_ids with a DM summary in flight
+        self._summary_tasks = set()  # strong refs so in-flight summaries aren't collected
+        self._dm_queues = {}  # author_id -> (asyncio.Queue of pending DMs, worker task)
+        self._dm_slots = asyncio.Semaphore(DM_MAX_CONCURRENT)
+        # Environment settings, read once the bot has loaded .env
+        self._temperature = float(os.getenv('SEEDKEEPER_TEMPERATURE', '1.0'))
+        self._owner_id = os.getenv('BOT_OWNER_ID')
+
+    async def enqueue_dm_conversation(self, message_data: Dict[str, Any]):
+        """Queue a DM for its author's worker.
+
+        DMs from one user are answered in order, so their session state stays
+        consistent; different users proceed concurrently up to DM_MAX_CONCURRENT.
+        Every DM is answered: on_message has already saved it to memory, so a
+        dropped one would later appear as an unanswered turn. A user with a
+        backlog still holds only one slot at a time.
+        """
+        author_id = str(message_data.get('author_id'))
+        entry = self._dm_queues.get(author_id)
+        if entry is None:
+            queue = asyncio.Queue()
+            queue.put_nowait(message_data)
+            # The task is kept next to its queue so it can't be collected mid-run
+            self._dm_queues[author_id] = (queue, asyncio.create_task(self._dm_worker(author_id, queue)))
+        else:
+            entry[0].put_nowait(message_data)
+
+    async def _dm_worker(self, author_id: str, queue: asyncio.Queue):
+        """Drain one user's DM queue, then retire."""
+        try:
+            while not queue.empty():
+                message_data = queue.get_nowait()
+                async with self._dm_slots:
+                    try:
+                        await self.handle_dm_conversation(message_data)
+                    except Exception as e:
+                        print(f"Error handling DM from {author_id}: {e}")
+        finally:
+            self._dm_queues.pop(author_id, None)
 
     async def handle_dm_conversation(self, message_data: Dict[str, Any]):
         """Handle natural DM conversations."""
-        author_id = message_data.get('author_id')
+        author_id = str(message_data.get('author_id'))
         raw_content = message_data.get('content', '')
         channel_id = message_data.get('channel_id')
 
         # Sanitize user input
         content = InputValidator.sanitize_string(raw_content, max_length=2000)
+        now = datetime.now(timezone.utc)  # one clock read per turn
 
         # Check if there's an active feedback session (auto-expire after 30 min)
         if author_id in self.bot.feedback_manager.sessions:
             session = self.bot.feedback_manager.sessions[author_id]
             session_ts = session.get('timestamp', '')
             try:
-                session_age = (datetime.utcnow() - datetime.fromisoformat(session_ts)).total_seconds()
+                # Session timestamps are naive UTC
+                session_age = (now.replace(tzinfo=None) - datetime.fromisoformat(session_ts)).total_seconds()
                 if session_age > 1800:  # 30 minutes
                     self.bot.feedback_manager.cancel_session(author_id)
             except (ValueError, TypeError):
@@ -50,47 +140,46 @@ class ConversationHandler:
             result = self.bot.feedback_manager.process_feedback_response(author_id, content)
 
             if result.get('complete'):
-                await self.bot.send_message(channel_id, result['message'], is_dm=True, author_id=author_id)
-
-                if result.get('success') and os.getenv('BOT_OWNER_ID') == author_id:
+                blocks = [result['message']]
+                pending = None
+                if result.get('success') and self._owner_id == author_id:
                     pending = self.bot.feedback_manager.get_pending_feedback_for_owner()
                     if pending:
-                        feedback_text = "**New Anonymous Feedback:**\n"
-                        for item in pending:
-                            feedback_text += f"\n**Feature:** {item['feature']}\n"
-                            feedback_text += f"**Interest:** {item['interest']}\n"
-                            feedback_text += f"**Details:** {item['details']}\n"
-                            feedback_text += "---\n"
-                        await self.bot.send_message(channel_id, feedback_text[:1900], is_dm=True, author_id=author_id)
-                        self.bot.feedback_manager.acknowledge_pending_feedback()
+                        blocks.append("\n**New Anonymous Feedback:**")
+                        blocks.extend(
+                            f"\n**Feature:** {item['feature']}\n"
+                            f"**Interest:** {item['interest']}\n"
+                            f"**Details:** {item['details']}\n"
+                            "---"
+                            for item in pending
+                        )
+
+                # Confirmation and any owner notification share messages when they
+                # fit; pages break on item boundaries rather than mid-item
+                await self.bot.send_chunks(channel_id, self.bot.pack_blocks(blocks),
+                                           is_dm=True, author_id=author_id)
+                if pending:
+                    self.bot.feedback_manager.acknowledge_pending_feedback()
             else:
                 await self.bot.send_message(channel_id, result.get('next_prompt', result.get('message')),
                                             is_dm=True, author_id=author_id)
             return
 
         # Get conversation history from in-memory store
-        conversation = self.bot._dm_conversations.get(author_id, [])
+        conversation = self.bot._dm_conversations.setdefault(
+            author_id, deque(maxlen=CONVERSATION_STORAGE_LIMIT))
 
         # Get personality for token limits
-        personality = self.bot.personality_manager.get_user_personality(str(author_id))
-
-        # Add persistent memories if enabled
-        persistent_memories = []
-        if self.bot.memory_manager.is_memory_enabled(author_id):
-            memories = self.bot.memory_manager.get_recent_memories(author_id, limit=PERSISTENT_MEMORY_LIMIT)
-            for mem in memories:
-                role = 'user' if mem['author'] == 'user' else 'assistant'
-                persistent_memories.append({'role': role, 'content': mem['content']})
+        personality = self.bot.personality_manager.get_user_personality(author_id)
 
         # Check if this looks like birthday info
-        birthday_keywords = ['birthday', 'born', 'birth', 'bday', 'born on', 'celebrate']
-        if any(keyword in content.lower() for keyword in birthday_keywords):
+        if len(content) >= BIRTHDAY_KEYWORD_MIN_LEN and BIRTHDAY_KEYWORDS_RE.search(content):
             parsed_results = self.bot.birthday_manager.parse_birthday_advanced(content)
             if parsed_results:
                 for result in parsed_results:
                     if result.get('month') and result.get('day'):
                         success, message = self.bot.birthday_manager.set_birthday(
-                            str(author_id), result['month'], result['day'], str(author_id), method="auto"
+                            author_id, result['month'], result['day'], author_id, method="auto"
                         )
                         if success:
                             formatted = self.bot.birthday_manager.format_birthday_date(result['month'], result['day'])
@@ -104,28 +193,41 @@ class ConversationHandler:
 
         # Generate natural response using LLM
         try:
-            context_messages = []
-            if persistent_memories:
-                context_messages.extend(persistent_memories[-PERSISTENT_MEMORY_LIMIT:])
-            for msg in conversation[-CONVERSATION_HISTORY_LIMIT:]:
-                context_messages.append({"role": msg['role'], "content": msg['content']})
+            # Persistent memories, then recent session history, then this message.
+            # The bundle's memories are [] when memory is disabled.
+            bundle = self.bot.memory_manager.get_context_bundle(author_id, limit=PERSISTENT_MEMORY_LIMIT)
+            context_messages = [
+                {"role": 'user' if mem['author'] == 'user' else 'assistant', "content": mem['content']}
+                for mem in _without_current(bundle['memories'], content)
+            ]
+            context_messages.extend(
+                {"role": msg['role'], "content": msg['content']}
+                for msg in _tail(conversation, CONVERSATION_HISTORY_LIMIT)
+            )
             context_messages.append({"role": "user", "content": content})
 
             system = self.bot._get_system_for_personality(personality, is_dm=True)
             max_tokens = personality.get('max_tokens', 800)
 
+            # Older session turns live in a running summary at the end of the
+            # system prompt; a system message mid-list trips some chat templates
+            model_personality = personality
+            dm_summary = self.bot._dm_summaries.get(author_id)
+            if dm_summary:
+                model_personality = _with_system_prompt(
+                    personality, f"{personality.get('system_prompt') or system}\n\nPrior context: {dm_summary}")
+
             # Get DM channel for typing indicator
-            user = self.bot.get_user(int(author_id)) or await self.bot.fetch_user(int(author_id))
-            dm_channel = user.dm_channel or await user.create_dm()
+            dm_channel = await self.bot.get_dm_channel(author_id)
 
             # Show typing while LLM generates
             async with dm_channel.typing():
                 result = await self.bot.model_client.complete(
-                    personality=personality,
+                    personality=model_personality,
                     system=system,
                     messages=context_messages,
                     max_tokens=max_tokens,
-                    temperature=float(os.getenv('SEEDKEEPER_TEMPERATURE', '1.0')),
+                    temperature=self._temperature,
                 )
             self.bot._record_api_usage_from_result(result, "dm",
                                                    user_id=author_id, channel_id=channel_id)
@@ -135,34 +237,79 @@ class ConversationHandler:
             if len(reply) <= 2000:
                 await self.bot.send_message(channel_id, reply, is_dm=True, author_id=author_id)
             else:
-                chunks = self.bot.split_message(reply)
-                for i, chunk in enumerate(chunks):
-                    await self.bot.send_message(channel_id, chunk, is_dm=True, author_id=author_id)
-                    if i < len(chunks) - 1:
-                        await asyncio.sleep(0.5)
+                await self.bot.send_chunks(channel_id, self.bot.iter_message_chunks(reply),
+                                           is_dm=True, author_id=author_id)
 
             # Save to in-memory conversation
-            conversation.append({'role': 'user', 'content': content[:500], 'timestamp': datetime.utcnow().isoformat()})
-            conversation.append({'role': 'assistant', 'content': reply[:500], 'timestamp': datetime.utcnow().isoformat()})
-            if len(conversation) > CONVERSATION_STORAGE_LIMIT:
-                conversation = conversation[-CONVERSATION_STORAGE_LIMIT:]
-            self.bot._dm_conversations[author_id] = conversation
+            now_iso = now.isoformat()
+            conversation.append({'role': 'user', 'content': _clip(content), 'timestamp': now_iso})
+            conversation.append({'role': 'assistant', 'content': _clip(reply), 'timestamp': now_iso})
+            if len(conversation) > DM_SUMMARY_THRESHOLD and author_id not in self._summarizing:
+                self._summarizing.add(author_id)
+                task = asyncio.create_task(self._summarize_dm_history(author_id, personality))
+                self._summary_tasks.add(task)
+                task.add_done_callback(self._summary_tasks.discard)
 
             # Save to persistent memory
-            if self.bot.memory_manager.is_memory_enabled(author_id):
+            if bundle['enabled']:
                 self.bot.memory_manager.add_memory(
-                    author_id, reply[:2000], 'bot', 'dm', None, channel_id
+                    author_id, _clip(reply, 2000), 'bot', 'dm', None, channel_id
                 )
 
         except Exception as e:
             print(f"Error in DM conversation: {e}")
             await self.bot.send_message(channel_id,
-                "I'm having trouble processing that right now, but I'm here!",
+                self.DM_ERROR_REPLY,
                 is_dm=True, author_id=author_id)
 
+    async def _summarize_dm_history(self, author_id: str, personality: dict):
+        """Fold the DM turns that fall outside the model's history window into the running summary."""
+        try:
+            conversation = self.bot._dm_conversations.get(author_id)
+            if not conversation or len(conversation) <= CONVERSATION_HISTORY_LIMIT:
+                return
+            # Only what _tail() would leave out of the prompt anyway
+            older = list(islice(conversation, 0, len(conversation) - CONVERSATION_HISTORY_LIMIT))
+
+            lines = [f"{'User' if msg['role'] == 'user' else 'Seedkeeper'}: {msg['content']}" for msg in older]
+            previous = self.bot._dm_summaries.get(author_id)
+            prompt = (
+                "Summarize this conversation so far in under "
+                f"{DM_SUMMARY_MAX_TOKENS} tokens. Be factual: keep names, preferences, "
+                "open questions and anything the user asked you to remember. "
+                "Output only the summary.\n\n"
+            )
+            if previous:
+                prompt += f"Earlier summary: {previous}\n\n"
+            prompt += "Conversation:\n" + "\n".join(lines)
+
+            result = await self.bot.model_client.complete(
+                personality=_with_system_prompt(personality, DM_SUMMARY_SYSTEM_PROMPT),
+                system=DM_SUMMARY_SYSTEM_PROMPT,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=DM_SUMMARY_MAX_TOKENS,
+                temperature=0.3,
+            )
+            self.bot._record_api_usage_from_result(result, "dm_summary", user_id=author_id)
+            if not result.text:
+                return
+            # The session was forgotten (!forgetme / !memory clear) while summarizing
+            if self.bot._dm_conversations.get(author_id) is not conversation:
+                return
+
+            # New turns may have arrived meanwhile; drop only what was summarized
+            for msg in older:
+                if conversation and conversation[0] is msg:
+                    conversation.popleft()
+            self.bot._dm_summaries[author_id] = result.text
+        except Exception as e:
+            print(f"Error summarizing DM history: {e}")
+        finally:
+            self._summarizing.discard(author_id)
+
     async def handle_mention_conversation(self, message_data: Dict[str, Any]):
         """Handle mentions that aren't clear commands."""
-        author_id = message_data.get('author_id')
+        author_id = str(message_data.get('author_id'))
         raw_content = message_data.get('content', '')
         channel_id = message_data.get('channel_id')
         guild_id = message_data.get('guild_id')
@@ -171,35 +318,31 @@ class ConversationHandler:
         # Sanitize user input
         content = InputValidator.sanitize_string(raw_content, max_length=2000)
 
-        # Save to memory
-        if self.bot.memory_manager.is_memory_enabled(author_id):
-            self.bot.memory_manager.add_memory(
-                author_id, content, 'user',
-                'guild' if guild_id else 'dm', guild_id, channel_id
-            )
+        memory = self.bot.memory_manager
+        channel_type = 'guild' if guild_id else 'dm'
 
         # Get personality for token limits
-        personality = self.bot.personality_manager.get_user_personality(str(author_id))
-
-        # Get channel-specific conversation context
-        recent_messages = self.bot.memory_manager.get_recent_memories(
-            author_id, limit=CONVERSATION_HISTORY_LIMIT,
-            channel_type='guild',
-            guild_id=guild_id,
-            channel_id=channel_id
-        )
+        personality = self.bot.personality_manager.get_user_personality(author_id)
 
         try:
-            messages = []
-            if recent_messages:
-                for msg in recent_messages[-CONVERSATION_HISTORY_LIMIT:]:
-                    role = 'user' if msg['author'] == 'user' else 'assistant'
-                    messages.append({"role": role, "content": msg['content']})
+            # Channel-specific context in one call; on_message has already saved
+            # the user's message. MemoryManager is not thread-safe, so it stays
+            # on the event loop alongside on_message's writes.
+            bundle = memory.get_context_bundle(
+                author_id, limit=CONVERSATION_HISTORY_LIMIT,
+                channel_type='guild', guild_id=guild_id, channel_id=channel_id)
+            memory_enabled = bundle['enabled']
+            recent_messages = _without_current(bundle['memories'], content)
+
+            messages = [
+                {"role": 'user' if msg['author'] == 'user' else 'assistant', "content": msg['content']}
+                for msg in recent_messages[-CONVERSATION_HISTORY_LIMIT:]
+            ]
 
             # Remove bot mention from content
-            clean_content = content
-            for mention_pattern in [f'<@{self.bot.user.id}>', f'<@!{self.bot.user.id}>']:
-                clean_content = clean_content.replace(mention_pattern, '').strip()
+            if self._mention_re is None:
+                self._mention_re = re.compile(rf'<@!?{self.bot.user.id}>')
+            clean_content = self._mention_re.sub('', content).strip()
 
             messages.append({
                 "role": "user",
@@ -219,24 +362,22 @@ class ConversationHandler:
                     system=system,
                     messages=messages,
                     max_tokens=max_tokens,
-                    temperature=float(os.getenv('SEEDKEEPER_TEMPERATURE', '1.0')),
+                    temperature=self._temperature,
                 )
             self.bot._record_api_usage_from_result(result, "mention",
                                                    user_id=author_id, channel_id=channel_id)
             reply = result.text
             if not reply:
-                reply = "I heard you, but my thoughts got tangled. Could you try again?"
+                reply = self.EMPTY_REPLY_FALLBACK
 
             # Save bot's response to memory
-            if self.bot.memory_manager.is_memory_enabled(author_id):
-                self.bot.memory_manager.add_memory(
-                    author_id, reply, 'assistant',
-                    'guild' if guild_id else 'dm', guild_id, channel_id
-                )
+            if memory_enabled:
+                memory.add_memory(author_id, reply, 'assistant',
+                                  channel_type, guild_id, channel_id)
 
             await self.bot.send_message(channel_id, reply, is_dm=False)
 
         except Exception as e:
             print(f"Error handling mention: {e}")
             await self.bot.send_message(channel_id,
-                f"Something went wrong: {type(e).__name__}. Try again in a moment?")
+                self.MENTION_ERROR_REPLY.format(error=type(e).__name__))
@@ -7,6 +7,15 @@ class CostHandler:
     def __init__(self, bot):
         self.bot = bot
 
+        # Subcommand -> section formatter; "full" renders all of them in this order
+        self._formatters = {
+            "today": self._format_cost_today,
+            "daily": self._format_cost_daily,
+            "monthly": self._format_cost_monthly,
+            "breakdown": self._format_cost_breakdown,
+            "users": self._format_cost_users,
+        }
+
     async def handle_cost_command(self, command_data: Dict[str, Any]):
         """Handle !cost command -- admin-only API cost analytics."""
         author_id = command_data.get('author_id')
@@ -14,22 +23,12 @@ class CostHandler:
         is_dm = command_data.get('is_dm', False)
         args = command_data.get('args', '').strip().lower()
 
-        subcommand = args.split()[0] if args else "today"
-
-        sections = []
-        if subcommand in ("today", "full"):
-            sections.append(self._format_cost_today())
-        if subcommand in ("daily", "full"):
-            sections.append(self._format_cost_daily())
-        if subcommand in ("monthly", "full"):
-            sections.append(self._format_cost_monthly())
-        if subcommand in ("breakdown", "full"):
-            sections.append(self._format_cost_breakdown())
-        if subcommand in ("users", "full"):
-            sections.append(self._format_cost_users())
+        subcommand = args.partition(' ')[0] or "today"
 
-        if not sections:
-            sections.append(self._format_cost_today())
+        if subcommand == "full":
+            sections = [fmt() for fmt in self._formatters.values()]
+        else:
+            sections = [self._formatters.get(subcommand, self._format_cost_today)()]
 
         text = "\n\n".join(sections)
         if len(text) > 1900:
@@ -56,17 +55,19 @@ class CostHandler:
 
     def _format_cost_daily(self) -> str:
         trend = self.bot.usage_tracker.get_daily_trend(7)
-        lines = ["**API Cost -- Last 7 Days**", "```"]
-        lines.append(f"{'Date':<12} {'Calls':>5} {'In':>8} {'Out':>8} {'Cost':>8}")
-        lines.append("-" * 45)
-        for day in trend:
-            lines.append(
-                f"{day['date']:<12} {day.get('calls',0):>5} "
-                f"{day.get('input_tokens',0):>8,} {day.get('output_tokens',0):>8,} "
-                f"${day.get('cost',0):>7.4f}"
-            )
-        lines.append("```")
-        return "\n".join(lines)
+        rows = [
+            f"{day['date']:<12} {day.get('calls',0):>5} "
+            f"{day.get('input_tokens',0):>8,} {day.get('output_tokens',0):>8,} "
+            f"${day.get('cost',0):>7.4f}"
+            for day in trend
+        ]
+        return "\n".join([
+            "**API Cost -- Last 7 Days**", "```",
+            f"{'Date':<12} {'Calls':>5} {'In':>8} {'Out':>8} {'Cost':>8}",
+            "-" * 45,
+            *rows,
+            "```",
+        ])
 
     def _format_cost_monthly(self) -> str:
         s = self.bot.usage_tracker.get_rolling_summary(30)
@@ -84,29 +85,35 @@ class CostHandler:
         return "\n".join(lines)
 
     def _format_cost_breakdown(self) -> str:
-        models = self.bot.usage_tracker.get_model_breakdown()
-        commands = self.bot.usage_tracker.get_command_breakdown()
-        lines = ["**API Cost -- Model Breakdown**", "```"]
-        for model, stats in sorted(models.items(), key=lambda x: x[1].get("cost", 0), reverse=True):
-            short = model.split("-")[1] if "-" in model else model
-            lines.append(f"{short:<12} {stats.get('calls',0):>5} calls  ${stats.get('cost',0):.4f}")
-        lines.append("```")
-        lines.append("")
-        lines.append("**API Cost -- Command Breakdown**")
-        lines.append("```")
-        for cmd, stats in sorted(commands.items(), key=lambda x: x[1].get("cost", 0), reverse=True):
-            lines.append(f"{cmd:<14} {stats.get('calls',0):>5} calls  ${stats.get('cost',0):.4f}")
-        lines.append("```")
-        return "\n".join(lines)
+        models = self.bot.usage_tracker.get_model_breakdown_sorted()
+        commands = self.bot.usage_tracker.get_command_breakdown_sorted()
+        model_rows = [
+            f"{(model.split('-')[1] if '-' in model else model):<12} {calls:>5} calls  ${cost:.4f}"
+            for model, calls, cost in models
+        ]
+        command_rows = [
+            f"{cmd:<14} {calls:>5} calls  ${cost:.4f}"
+            for cmd, calls, cost in commands
+        ]
+        return "\n".join([
+            "**API Cost -- Model Breakdown**", "```",
+            *model_rows,
+            "```",
+            "",
+            "**API Cost -- Command Breakdown**", "```",
+            *command_rows,
+            "```",
+        ])
 
     def _format_cost_users(self) -> str:
         users = self.bot.usage_tracker.get_user_breakdown(10)
         if not users:
             return "**API Cost -- Top Users**\nNo user data yet."
-        lines = ["**API Cost -- Top Users**", "```"]
-        lines.append(f"{'User ID':<20} {'Calls':>5} {'Cost':>8}")
-        lines.append("-" * 35)
-        for uid, stats in users:
-            lines.append(f"{uid:<20} {stats.get('calls',0):>5} ${stats.get('cost',0):>7.4f}")
-        lines.append("```")
-        return "\n".join(lines)
+        rows = [f"{uid:<20} {calls:>5} ${cost:>7.4f}" for uid, calls, cost in users]
+        return "\n".join([
+            "**API Cost -- Top Users**", "```",
+            f"{'User ID':<20} {'Calls':>5} {'Cost':>8}",
+            "-" * 35,
+            *rows,
+            "```",
+        ])
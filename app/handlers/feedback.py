@@ -3,6 +3,37 @@
 import os
 from typing import Dict, Any
 
+ADMIN_HELP_TEXT = """🌱 **Admin Feedback Commands**
+
+**Available commands:**
+- `!feedback pending` - Get all unread feedback
+- `!feedback summary` - View statistics and trends
+- `!feedback help` - Show this help message
+
+**Regular users:**
+- `!feedback` - Start a feedback session (moves to DM)"""
+
+# Admin-only subcommands; anything else starts a feedback session
+ADMIN_SUBCOMMANDS = frozenset({'summary', 'pending', 'get', 'help'})
+
+# Only the suggested feature varies between sessions
+SESSION_PROMPT = """🌱 **Garden Feature Feedback Session**
+
+Welcome! I'd love to hear your thoughts on potential features for The Garden Cafe.
+
+**How this works:**
+1. I'll suggest a feature idea
+2. You share if it interests you (or type 'skip')
+3. Optionally, tell me what aspects would be valuable
+4. Choose whether to share anonymously with development
+
+💡 **Today's feature idea:**
+**"{feature}"**
+
+**What do you think?** Would this be interesting or useful to you?
+
+*Just type your response here in our DM. Type 'cancel' anytime to exit.*"""
+
 
 class FeedbackHandler:
     def __init__(self, bot):
@@ -16,30 +47,29 @@ class FeedbackHandler:
         is_dm = command_data.get('is_dm', False)
 
         # Admin commands respond in the same channel
-        if self.bot.admin_manager.is_admin(author_id) and args in ['summary', 'pending', 'get', 'help']:
+        if args in ADMIN_SUBCOMMANDS and self.bot.admin_manager.is_admin(author_id):
             if args == 'help':
-                help_text = """🌱 **Admin Feedback Commands**
-
-**Available commands:**
-- `!feedback pending` - Get all unread feedback
-- `!feedback summary` - View statistics and trends
-- `!feedback help` - Show this help message
-
-**Regular users:**
-- `!feedback` - Start a feedback session (moves to DM)"""
-                await self.bot.send_message(channel_id, help_text, is_dm=is_dm, author_id=author_id)
+                await self.bot.send_message(channel_id, ADMIN_HELP_TEXT, is_dm=is_dm, author_id=author_id)
                 return
 
             elif args in ('pending', 'get'):
                 pending = self.bot.feedback_manager.get_pending_feedback_for_owner()
                 if pending:
-                    feedback_text = "**Pending Anonymous Feedback:**\n"
+                    parts = ["**Pending Anonymous Feedback:**\n"]
+                    length = len(parts[0])
                     for item in pending:
-                        feedback_text += f"\n**Feature:** {item['feature']}\n"
-                        feedback_text += f"**Interest:** {item['interest']}\n"
-                        feedback_text += f"**Details:** {item.get('details', 'No details provided')}\n"
-                        feedback_text += f"**When:** {item.get('timestamp', 'Unknown')}\n"
-                        feedback_text += "---\n"
+                        entry = (
+                            f"\n**Feature:** {item['feature']}\n"
+                            f"**Interest:** {item['interest']}\n"
+                            f"**Details:** {item.get('details', 'No details provided')}\n"
+                            f"**When:** {item.get('timestamp', 'Unknown')}\n"
+                            "---\n"
+                        )
+                        parts.append(entry)
+                        length += len(entry)
+                        if length >= 1900:
+                            break  # the rest would be cut off anyway
+                    feedback_text = "".join(parts)
                     await self.bot.send_message(channel_id, feedback_text[:1900], is_dm=is_dm, author_id=author_id)
                     self.bot.feedback_manager.acknowledge_pending_feedback()
                 else:
@@ -56,10 +86,14 @@ class FeedbackHandler:
                         is_dm=is_dm, author_id=author_id)
                     return
 
-                summary_text = f"**Feedback Summary Report**\n"
-                summary_text += "=" * 40 + "\n"
-                summary_text += f"**Total Responses:** {summary['total']}\n"
-                summary_text += "=" * 40 + "\n\n"
+                rule = "=" * 40
+                parts = [
+                    "**Feedback Summary Report**\n",
+                    f"{rule}\n",
+                    f"**Total Responses:** {summary['total']}\n",
+                    f"{rule}\n\n",
+                ]
+                length = sum(map(len, parts))
 
                 if summary['features']:
                     sorted_features = sorted(summary['features'].items(),
@@ -68,11 +102,18 @@ class FeedbackHandler:
                     for feature, stats in sorted_features:
                         interest_rate = (stats['interested'] / stats['count'] * 100) if stats['count'] > 0 else 0
                         feature_name = feature if len(feature) <= 45 else feature[:42] + "..."
-                        summary_text += f"**Feature:** {feature_name}\n"
-                        summary_text += f"  Responses: {stats['count']}\n"
-                        summary_text += f"  Interested: {stats['interested']} users ({interest_rate:.0f}%)\n"
-                        summary_text += f"  Not interested: {stats['count'] - stats['interested']} users\n\n"
-
+                        entry = (
+                            f"**Feature:** {feature_name}\n"
+                            f"  Responses: {stats['count']}\n"
+                            f"  Interested: {stats['interested']} users ({interest_rate:.0f}%)\n"
+                            f"  Not interested: {stats['count'] - stats['interested']} users\n\n"
+                        )
+                        parts.append(entry)
+                        length += len(entry)
+                        if length >= 1900:
+                            break  # the rest would be cut off anyway
+
+                summary_text = "".join(parts)
                 await self.bot.send_message(channel_id, summary_text[:1900], is_dm=is_dm, author_id=author_id)
                 return
 
@@ -93,21 +134,6 @@ class FeedbackHandler:
             return
 
         feature = result['feature']
-        prompt = f"""🌱 **Garden Feature Feedback Session**
-
-Welcome! I'd love to hear your thoughts on potential features for The Garden Cafe.
-
-**How this works:**
-1. I'll suggest a feature idea
-2. You share if it interests you (or type 'skip')
-3. Optionally, tell me what aspects would be valuable
-4. Choose whether to share anonymously with development
-
-💡 **Today's feature idea:**
-**"{feature}"**
-
-**What do you think?** Would this be interesting or useful to you?
-
-*Just type your response here in our DM. Type 'cancel' anytime to exit.*"""
+        prompt = SESSION_PROMPT.format(feature=feature)
 
         await self.bot.send_message(channel_id, prompt, is_dm=is_dm, author_id=author_id)
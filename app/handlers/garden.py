@@ -1,12 +1,31 @@
 """Garden command handlers: reflect, about, hello."""
 
 import random
+import time
+from collections import deque
 from typing import Dict, Any
 
+HELLO_PROMPT = "Someone just said hello. Give them a warm, brief greeting."
+
 
 class GardenHandler:
+    # Recent LLM greetings kept per personality and reused for a while
+    HELLO_CACHE_SIZE = 5
+    HELLO_CACHE_TTL = 300  # seconds
+    HELLO_REUSE_MIN = 3  # fresh greetings needed before reusing any
+    HELLO_REUSE_RATE = 0.7
+
     def __init__(self, bot):
         self.bot = bot
+        # personality name -> deque of (monotonic timestamp, greeting)
+        self._hello_cache = {}
+
+        # Command dispatch: name -> handler(channel_id, is_dm, author_id)
+        self._commands = {
+            'about': self._handle_about,
+            'hello': self._handle_hello,
+            'seed': self._generate_seed_response,
+        }
 
     async def handle_garden_command(self, command_data: Dict[str, Any]):
         """Handle garden commands."""
@@ -15,30 +34,42 @@ class GardenHandler:
         is_dm = command_data.get('is_dm', False)
         author_id = command_data.get('author_id')
 
-        if command == 'about':
-            response = self._generate_about_response()
-            await self.bot.send_message(channel_id, response, is_dm=is_dm, author_id=author_id)
-        elif command == 'hello':
-            response = await self._generate_hello_response(author_id)
-            await self.bot.send_message(channel_id, response, is_dm=is_dm, author_id=author_id)
-        elif command == 'seed':
-            await self._generate_seed_response(channel_id, is_dm, author_id)
+        handler = self._commands.get(command)
+        if handler:
+            await handler(channel_id, is_dm, author_id)
         else:
             await self.bot.send_message(channel_id, f"Unknown command: {command}",
                                         is_dm=is_dm, author_id=author_id)
 
+    async def _handle_about(self, channel_id: str, is_dm: bool, author_id: str):
+        await self.bot.send_message(channel_id, self._generate_about_response(),
+                                    is_dm=is_dm, author_id=author_id)
+
+    async def _handle_hello(self, channel_id: str, is_dm: bool, author_id: str):
+        response = await self._generate_hello_response(author_id)
+        await self.bot.send_message(channel_id, response, is_dm=is_dm, author_id=author_id)
+
     async def _generate_hello_response(self, author_id: str) -> str:
-        """Generate a greeting via the LLM."""
+        """Generate a greeting via the LLM, reusing recent ones most of the time."""
         personality = self.bot.personality_manager.get_user_personality(str(author_id))
 
+        recent = self._hello_cache.setdefault(personality.get('name'), deque(maxlen=self.HELLO_CACHE_SIZE))
+        now = time.monotonic()
+        while recent and now - recent[0][0] > self.HELLO_CACHE_TTL:
+            recent.popleft()
+        if len(recent) >= self.HELLO_REUSE_MIN and random.random() < self.HELLO_REUSE_RATE:
+            return random.choice(recent)[1]
+
         try:
             result = await self.bot.model_client.complete(
                 personality=personality,
                 system=personality.get('system_prompt', ''),
-                messages=[{"role": "user", "content": "Someone just said hello. Give them a warm, brief greeting."}],
+                messages=[{"role": "user", "content": HELLO_PROMPT}],
                 max_tokens=150,
                 temperature=0.9,
             )
+            if result.text:
+                recent.append((now, result.text))
             return result.text
         except Exception as e:
             print(f"Error generating hello: {e}")
@@ -48,26 +79,15 @@ class GardenHandler:
         """Pick a random perspective, reflect on it, share the source URL."""
         await self.bot.send_typing(channel_id, is_dm=is_dm, author_id=author_id, duration=3)
 
-        # Get a random perspective
-        all_perspectives = self.bot._views_manager.get_all_perspectives()
-        if not all_perspectives:
+        # Get a random perspective (name, URL and truncation are precomputed)
+        perspectives = self.bot._views_manager.get_all_perspectives_prepared()
+        if not perspectives:
             await self.bot.send_message(channel_id,
                 "No perspectives loaded right now.",
                 is_dm=is_dm, author_id=author_id)
             return
 
-        name, content = random.choice(all_perspectives)
-
-        # Build URL from perspective name (e.g., "3-perspectives/2x2" -> "lightward.com/2x2")
-        url_slug = name.replace('3-perspectives/', '').replace('2-watch-this/', '')
-        source_url = f"https://lightward.com/{url_slug}"
-
-        # Truncate content if too long
-        if len(content) > 2000:
-            content = content[:2000] + "..."
-
-        # Clean up the name for display
-        display_name = url_slug.replace('-', ' ').title()
+        display_name, source_url, content = random.choice(perspectives)
 
         personality = self.bot.personality_manager.get_user_personality(str(author_id))
 
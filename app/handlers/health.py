@@ -1,30 +1,61 @@
 """Health check command handler."""
 
-import json
-import urllib.request
-from datetime import datetime
+import asyncio
+import time
 from typing import Dict, Any, Optional
 
 
 class HealthHandler:
+    INFO_TTL = 600          # seconds model metadata is reused
+    INFO_FAILURE_TTL = 30   # seconds a failed lookup is remembered
+
     def __init__(self, bot):
         self.bot = bot
-
-    def _get_ollama_model_info(self, base_url: str, model: str) -> Optional[dict]:
-        """Fetch model info from Ollama API."""
+        # (base_url, model) -> (monotonic timestamp, info dict or None)
+        self._info_cache = {}
+        self._info_inflight = {}  # (base_url, model) -> Task fetching it right now
+        self._stamp = (None, '')  # (epoch minute, "HH:MM UTC")
+
+    def _utc_stamp(self) -> str:
+        """Current UTC time as "HH:MM UTC", formatted once per minute."""
+        minute = int(time.time() // 60)
+        if self._stamp[0] != minute:
+            self._stamp = (minute, f"{(minute // 60) % 24:02d}:{minute % 60:02d} UTC")
+        return self._stamp[1]
+
+    async def _get_ollama_model_info(self, base_url: str, model: str) -> Optional[dict]:
+        """Fetch model info from Ollama API (cached; metadata is fixed while loaded)."""
+        key = (base_url, model)
+        entry = self._info_cache.get(key)
+        if entry:
+            cached_at, info = entry
+            ttl = self.INFO_TTL if info is not None else self.INFO_FAILURE_TTL
+            if time.monotonic() - cached_at < ttl:
+                return info
+
+        # Concurrent !health calls share one in-flight request
+        task = self._info_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_ollama_model_info(base_url, model))
+            self._info_inflight[key] = task
+            task.add_done_callback(lambda _: self._info_inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_ollama_model_info(self, base_url: str, model: str) -> Optional[dict]:
         try:
             # Convert OpenAI-style URL to Ollama native
             api_url = base_url.replace('/v1', '') + '/api/show'
-            req = urllib.request.Request(
-                api_url,
-                data=json.dumps({"name": model}).encode('utf-8'),
-                headers={'Content-Type': 'application/json'},
-                method='POST'
-            )
-            with urllib.request.urlopen(req, timeout=5) as resp:
-                return json.loads(resp.read().decode('utf-8'))
-        except Exception:
-            return None
+            async with self.bot.http_session.post(api_url, json={"name": model}) as resp:
+                resp.raise_for_status()
+                info = await resp.json(content_type=None)
+        except Exception as e:
+            # Any failure (including a closed session at shutdown) is cached as None,
+            # so callers sharing this task get an answer rather than the exception
+            print(f"[Health] Ollama model info lookup failed: {e}")
+            info = None
+
+        self._info_cache[(base_url, model)] = (time.monotonic(), info)
+        return info
 
     async def handle_health_command(self, command_data: Dict[str, Any]):
         """Handle !health command."""
@@ -36,25 +67,28 @@ class HealthHandler:
         personality = self.bot.personality_manager.get_default()
         model_display = personality.get('display_name', 'Unknown')
         model_name = personality.get('model', 'default')
-        provider = personality.get('provider', 'unknown')
-        is_local = provider == 'openai_compatible'
-
-        health_text = f"""**Seedkeeper Health**
-
-**System**
-- Status: {"Online" if self.bot.is_ready() else "Offline"}
-- Latency: {self.bot.latency*1000:.0f}ms
-
-**Model**
-- {model_display}
-- Engine: `{model_name}`"""
+        is_local = personality.get('provider', 'unknown') == 'openai_compatible'
+        base_url = personality.get('base_url', '')
+        memory_limit = personality.get('memory_limit', 5)
+        max_tokens = personality.get('max_tokens', 800)
+
+        parts = [
+            "**Seedkeeper Health**",
+            "",
+            "**System**",
+            f"- Status: {'Online' if self.bot.is_ready() else 'Offline'}",
+            f"- Latency: {self.bot.latency*1000:.0f}ms",
+            "",
+            "**Model**",
+            f"- {model_display}",
+            f"- Engine: `{model_name}`",
+        ]
 
         if is_local:
-            health_text += "\n- Type: Local (no API cost)"
+            parts.append("- Type: Local (no API cost)")
 
             # Get nerdy Ollama details
-            base_url = personality.get('base_url', '')
-            ollama_info = self._get_ollama_model_info(base_url, model_name)
+            ollama_info = await self._get_ollama_model_info(base_url, model_name)
 
             if ollama_info:
                 details = ollama_info.get('details', {})
@@ -62,32 +96,34 @@ class HealthHandler:
 
                 params = details.get('parameter_size', '?')
                 quant = details.get('quantization_level', '?')
-                ctx = model_info.get('qwen2.context_length', model_info.get('llama.context_length', '?'))
+                ctx = model_info.get('qwen2.context_length') or model_info.get('llama.context_length')
+                ctx_text = f"{ctx:,}" if isinstance(ctx, int) else "?"
                 family = details.get('family', '?')
 
-                health_text += f"""
-
-**Architecture**
-- Parameters: {params}
-- Quantization: {quant}
-- Context: {ctx:,} tokens
-- Family: {family}
-- Format: {details.get('format', 'gguf')}"""
+                parts.extend([
+                    "",
+                    "**Architecture**",
+                    f"- Parameters: {params}",
+                    f"- Quantization: {quant}",
+                    f"- Context: {ctx_text} tokens",
+                    f"- Family: {family}",
+                    f"- Format: {details.get('format', 'gguf')}",
+                ])
 
             # Show personality settings
-            memory_limit = personality.get('memory_limit', 5)
-            max_tokens = personality.get('max_tokens', 800)
-            health_text += f"""
-
-**Settings**
-- Memory depth: {memory_limit} messages
-- Max response: {max_tokens} tokens"""
+            parts.extend([
+                "",
+                "**Settings**",
+                f"- Memory depth: {memory_limit} messages",
+                f"- Max response: {max_tokens} tokens",
+            ])
 
         else:
-            health_text += "\n- Type: Cloud API"
+            parts.append("- Type: Cloud API")
             perspective_count = len(self.bot._views_manager.get_all_perspectives())
-            health_text += f"\n\n**Knowledge Base**\n- {perspective_count} Lightward perspectives"
+            parts.extend(["", "**Knowledge Base**", f"- {perspective_count} Lightward perspectives"])
 
-        health_text += f"\n\n*{datetime.utcnow().strftime('%H:%M UTC')}*"
+        parts.extend(["", f"*{self._utc_stamp()}*"])
+        health_text = "\n".join(parts)
 
         await self.bot.send_message(channel_id, health_text, is_dm=is_dm, author_id=author_id)
@@ -1,12 +1,45 @@
 """Activity insights command handler - the secret sauce dashboard."""
 
-from typing import Dict, Any
+import heapq
+from typing import Dict, Any, Callable, Optional
+
+INSIGHTS_HELP_TEXT = """**Insights Dashboard**
+
+`!insights` - Quick summary
+`!insights today` - Today's details
+`!insights trend` - 7-day breakdown
+`!insights peak` - Hourly patterns
+`!insights commands` - Command leaderboard
+`!insights llm` - LLM/token usage
+`!insights lifetime` - All-time stats
+`!insights full` - Everything"""
 
 
 class InsightsHandler:
     def __init__(self, bot):
         self.bot = bot
 
+        # Subcommand -> section formatter
+        self._sections = {
+            "summary": self._format_summary,
+            "today": self._format_today,
+            "peak": self._format_peak_hours,
+            "trend": self._format_trend,
+            "commands": self._format_command_stats,
+            "lifetime": self._format_lifetime,
+            "llm": self._format_llm_usage,
+            "tokens": self._format_llm_usage,
+            "model": self._format_llm_usage,
+        }
+        # Sections rendered by "full", in order
+        self._full_sections = (
+            self._format_summary,
+            self._format_llm_summary,
+            self._format_trend,
+            self._format_command_stats,
+            self._format_peak_hours,
+        )
+
     async def handle_insights_command(self, command_data: Dict[str, Any]):
         """Handle !insights command -- admin-only activity dashboard."""
         author_id = command_data.get('author_id')
@@ -14,33 +47,25 @@ class InsightsHandler:
         is_dm = command_data.get('is_dm', False)
         args = command_data.get('args', '').strip().lower()
 
-        subcommand = args.split()[0] if args else "summary"
-
-        if subcommand == "summary" or subcommand == "":
-            text = self._format_summary()
-        elif subcommand == "today":
-            text = self._format_today()
-        elif subcommand == "peak":
-            text = self._format_peak_hours()
-        elif subcommand == "trend":
-            text = self._format_trend()
-        elif subcommand == "commands":
-            text = self._format_command_stats()
-        elif subcommand == "lifetime":
-            text = self._format_lifetime()
-        elif subcommand in ("llm", "tokens", "model"):
-            text = self._format_llm_usage()
-        elif subcommand == "full":
-            sections = [
-                self._format_summary(),
-                self._format_llm_summary(),
-                self._format_trend(),
-                self._format_command_stats(),
-                self._format_peak_hours(),
-            ]
+        subcommand = args.partition(' ')[0] or "summary"
+
+        if subcommand == "full":
+            # Fetch tracker stats once and share them across every section
+            stats = {
+                "activity": self.bot.activity_tracker.get_all_stats(),
+                "usage": self.bot.usage_tracker.get_all_stats(),
+            }
+            sections = []
+            length = 0
+            for fmt in self._full_sections:
+                if length > 1900:
+                    break  # past the message limit already; later sections would be cut
+                section = fmt(stats)
+                sections.append(section)
+                length += len(section) + 2
             text = "\n\n".join(sections)
         else:
-            text = self._format_help()
+            text = self._sections.get(subcommand, self._format_help)()
 
         # Truncate if too long
         if len(text) > 1900:
@@ -48,16 +73,21 @@ class InsightsHandler:
 
         await self.bot.send_message(channel_id, text, is_dm=is_dm, author_id=str(author_id))
 
-    def _format_summary(self) -> str:
+    @staticmethod
+    def _pick(stats: Optional[Dict[str, Any]], source: str, key: str, fetch: Callable[[], Any]) -> Any:
+        """Use a pre-fetched stat from a full dashboard, or fetch it for a single section."""
+        return stats[source][key] if stats else fetch()
+
+    def _format_summary(self, stats: Optional[Dict[str, Any]] = None) -> str:
         """Quick 24-hour summary with sparkline."""
         tracker = self.bot.activity_tracker
-        summary = tracker.get_24h_summary()
-        peak = tracker.get_peak_hours()
-        sparkline = tracker.get_sparkline(7)
-        avg_response = tracker.get_avg_response_time()
+        summary = self._pick(stats, "activity", "summary_24h", tracker.get_24h_summary)
+        peak = self._pick(stats, "activity", "peak_hours", tracker.get_peak_hours)
+        sparkline = self._pick(stats, "activity", "sparkline", lambda: tracker.get_sparkline(7))
+        avg_response = self._pick(stats, "activity", "avg_response_time", tracker.get_avg_response_time)
 
         # Get LLM stats for today
-        llm = self.bot.usage_tracker.get_today_summary()
+        llm = self._pick(stats, "usage", "today", self.bot.usage_tracker.get_today_summary)
 
         lines = [
             "**Insights -- Last 24 Hours**",
@@ -113,10 +143,10 @@ class InsightsHandler:
 
         return "\n".join(lines)
 
-    def _format_peak_hours(self) -> str:
+    def _format_peak_hours(self, stats: Optional[Dict[str, Any]] = None) -> str:
         """Peak hours analysis with hourly distribution."""
         tracker = self.bot.activity_tracker
-        peak = tracker.get_peak_hours()
+        peak = self._pick(stats, "activity", "peak_hours", tracker.get_peak_hours)
 
         lines = [
             "**Insights -- Peak Hours**",
@@ -136,26 +166,26 @@ class InsightsHandler:
 
         # Create a compact bar chart
         dist = peak["distribution"]
-        max_val = max(dist.values()) if dist.values() else 1
+        counts = [dist.get(hour, 0) for hour in range(24)]
+        max_val = max(counts) or 1  # peak_hour is set, so some hour is non-zero
 
-        for hour in range(24):
-            count = dist.get(hour, 0)
-            bar_len = int((count / max_val) * 15) if max_val > 0 else 0
-            bar = "█" * bar_len
-            time_label = f"{hour:02d}"
-            lines.append(f"{time_label} {bar} {count}")
+        lines.extend(
+            f"{hour:02d} {'█' * (count * 15 // max_val)} {count}"
+            for hour, count in enumerate(counts)
+        )
 
         lines.append("```")
         return "\n".join(lines)
 
-    def _format_trend(self) -> str:
+    def _format_trend(self, stats: Optional[Dict[str, Any]] = None) -> str:
         """7-day trend with daily breakdown."""
         tracker = self.bot.activity_tracker
-        trend = tracker.get_weekly_trend()
-        sparkline = tracker.get_sparkline(7)
+        trend = self._pick(stats, "activity", "weekly_trend", tracker.get_weekly_trend)
+        sparkline = self._pick(stats, "activity", "sparkline", lambda: tracker.get_sparkline(7))
 
         # Get LLM daily trend too
-        llm_trend = self.bot.usage_tracker.get_daily_trend(7)
+        llm_trend = self._pick(stats, "usage", "daily_trend",
+                               lambda: self.bot.usage_tracker.get_daily_trend(7))
 
         lines = [
             "**Insights -- 7-Day Trend**",
@@ -167,15 +197,17 @@ class InsightsHandler:
             "-" * 27,
         ]
 
-        # Merge activity and LLM data
-        llm_by_date = {d['date']: d for d in llm_trend}
+        # Merge activity and LLM data: both trackers cover the same 7 UTC days,
+        # oldest first, so rows line up unless the day rolled over in between
+        if [d['date'] for d in llm_trend] == [d['date'] for d in trend]:
+            llm_calls_by_day = [d.get('calls', 0) for d in llm_trend]
+        else:
+            by_date = {d['date']: d.get('calls', 0) for d in llm_trend}
+            llm_calls_by_day = [by_date.get(d['date'], 0) for d in trend]
 
-        for day in trend:
-            short_date = day['date'][5:]  # MM-DD
-            llm_day = llm_by_date.get(day['date'], {})
-            llm_calls = llm_day.get('calls', 0)
+        for day, llm_calls in zip(trend, llm_calls_by_day):
             lines.append(
-                f"{short_date:<8} {day['messages']:>5} "
+                f"{day['short_date']:<8} {day['messages']:>5} "
                 f"{day['unique_users']:>5} {llm_calls:>5}"
             )
 
@@ -191,26 +223,26 @@ class InsightsHandler:
 
         return "\n".join(lines)
 
-    def _format_command_stats(self) -> str:
+    def _format_command_stats(self, stats: Optional[Dict[str, Any]] = None) -> str:
         """Command usage leaderboard."""
         tracker = self.bot.activity_tracker
-        commands = tracker.get_command_leaderboard(30)
+        top, total = self._pick(stats, "activity", "top_commands",
+                                lambda: tracker.get_top_commands(30, 8))
 
         lines = [
             "**Insights -- Top Commands (30d)**",
             "",
         ]
 
-        if not commands:
+        if not top:
             lines.append("No command data yet.")
             return "\n".join(lines)
 
         lines.append("```")
-        for cmd, count in list(commands.items())[:8]:
+        for cmd, count in top:
             lines.append(f"!{cmd:<12} {count:>4}")
         lines.append("```")
 
-        total = sum(commands.values())
         lines.append(f"Total: **{total}** commands")
 
         return "\n".join(lines)
@@ -274,17 +306,17 @@ class InsightsHandler:
         if commands:
             lines.append("")
             lines.append("**By Type**")
-            for cmd, stats in sorted(commands.items(), key=lambda x: x[1].get("calls", 0), reverse=True)[:5]:
+            for cmd, stats in heapq.nlargest(5, commands.items(), key=lambda x: x[1].get("calls", 0)):
                 lines.append(f"  {cmd}: {stats.get('calls', 0)} calls")
 
         return "\n".join(lines)
 
-    def _format_llm_summary(self) -> str:
+    def _format_llm_summary(self, stats: Optional[Dict[str, Any]] = None) -> str:
         """Compact LLM summary for full view."""
         tracker = self.bot.usage_tracker
-        today = tracker.get_today_summary()
+        today = self._pick(stats, "usage", "today", tracker.get_today_summary)
         lt = today.get('lifetime', {})
-        rolling = tracker.get_rolling_summary(30)
+        rolling = self._pick(stats, "usage", "rolling_30d", lambda: tracker.get_rolling_summary(30))
 
         total_tokens = lt.get('total_input_tokens', 0) + lt.get('total_output_tokens', 0)
 
@@ -300,13 +332,4 @@ class InsightsHandler:
 
     def _format_help(self) -> str:
         """Help text for insights command."""
-        return """**Insights Dashboard**
-
-`!insights` - Quick summary
-`!insights today` - Today's details
-`!insights trend` - 7-day breakdown
-`!insights peak` - Hourly patterns
-`!insights commands` - Command leaderboard
-`!insights llm` - LLM/token usage
-`!insights lifetime` - All-time stats
-`!insights full` - Everything"""
+        return INSIGHTS_HELP_TEXT
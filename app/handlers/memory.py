@@ -1,11 +1,39 @@
 """Memory command handlers: memory toggle/status/clear and forgetme."""
 
+import time
+from collections import OrderedDict
 from typing import Dict, Any
 
+MEMORY_HELP_TEXT = (
+    "🧠 **Memory Commands**\n"
+    "`!memory` - Toggle memory on/off\n"
+    "`!memory clear` - Clear conversation history\n"
+    "`!memory status` - Check memory status"
+)
+
 
 class MemoryHandler:
+    STATUS_TTL = 3  # seconds a user's memory counts are reused for repeated !memory status
+
     def __init__(self, bot):
         self.bot = bot
+        # author_id -> (monotonic, counts), oldest first
+        self._status_cache: OrderedDict = OrderedDict()
+
+    def _memory_counts(self, author_id: str) -> Dict[str, int]:
+        """Per-channel-type memory counts, briefly cached per user."""
+        now = time.monotonic()
+        hit = self._status_cache.get(author_id)
+        if hit:
+            if now - hit[0] < self.STATUS_TTL:
+                return hit[1]
+            del self._status_cache[author_id]
+        counts = self.bot.memory_manager.count_by_channel_type(author_id)
+        self._status_cache[author_id] = (now, counts)
+        # Entries share one TTL, so expired ones are all at the front
+        while now - next(iter(self._status_cache.values()))[0] >= self.STATUS_TTL:
+            self._status_cache.popitem(last=False)
+        return counts
 
     async def handle_memory_command(self, command_data: Dict[str, Any]):
         """Handle memory-related commands."""
@@ -15,6 +43,8 @@ class MemoryHandler:
         is_dm = command_data.get('is_dm', False)
 
         if not args:
+            # Status counts depend on the setting being toggled
+            self._status_cache.pop(author_id, None)
             if self.bot.memory_manager.is_memory_enabled(author_id):
                 self.bot.memory_manager.disable_memory(author_id)
                 await self.bot.send_message(channel_id,
@@ -27,13 +57,16 @@ class MemoryHandler:
                     is_dm=is_dm, author_id=author_id)
         elif args[0] == 'clear':
             self.bot.memory_manager.clear_user_memory(author_id)
+            self.bot.forget_dm_session(author_id)
+            self._status_cache.pop(author_id, None)
             await self.bot.send_message(channel_id,
                 "🌱 Memory cleared. Starting fresh!",
                 is_dm=is_dm, author_id=author_id)
         elif args[0] == 'status':
             enabled = self.bot.memory_manager.is_memory_enabled(author_id)
-            dm_count = len(self.bot.memory_manager.get_recent_memories(author_id, limit=100, channel_type='dm'))
-            guild_count = len(self.bot.memory_manager.get_recent_memories(author_id, limit=100, channel_type='guild'))
+            counts = self._memory_counts(author_id)
+            dm_count = counts.get('dm', 0)
+            guild_count = counts.get('guild', 0)
             total_count = dm_count + guild_count
             status = "enabled" if enabled else "disabled"
             await self.bot.send_message(channel_id,
@@ -47,11 +80,7 @@ class MemoryHandler:
                 f"- Your DM conversations never appear in public channels",
                 is_dm=is_dm, author_id=author_id)
         else:
-            await self.bot.send_message(channel_id,
-                "🧠 **Memory Commands**\n"
-                "`!memory` - Toggle memory on/off\n"
-                "`!memory clear` - Clear conversation history\n"
-                "`!memory status` - Check memory status",
+            await self.bot.send_message(channel_id, MEMORY_HELP_TEXT,
                 is_dm=is_dm, author_id=author_id)
 
     async def handle_forgetme_command(self, command_data: Dict[str, Any]):
@@ -61,6 +90,8 @@ class MemoryHandler:
         is_dm = command_data.get('is_dm', False)
 
         self.bot.memory_manager.clear_user_memory(author_id)
+        self.bot.forget_dm_session(author_id)
+        self._status_cache.pop(author_id, None)
         await self.bot.send_message(channel_id,
             "🌱 I've forgotten everything we've discussed. We're starting fresh, like meeting for the first time.\n\n"
             "*The garden gate swings open to new possibilities...*",
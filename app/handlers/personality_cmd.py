@@ -6,6 +6,7 @@ from typing import Dict, Any
 class PersonalityHandler:
     def __init__(self, bot):
         self.bot = bot
+        self._reply = None  # (personality_manager.version, rendered reply)
 
     async def handle_personality_command(self, command_data: Dict[str, Any]):
         """Handle !personality command - currently local-only mode."""
@@ -13,11 +14,17 @@ class PersonalityHandler:
         is_dm = command_data.get('is_dm', False)
         author_id = command_data.get('author_id')
 
-        personality = self.bot.personality_manager.get_default()
+        # In local-only mode, just show current personality; the reply only
+        # changes when personalities are reloaded
+        manager = self.bot.personality_manager
+        if self._reply is None or self._reply[0] != manager.version:
+            personality = manager.get_default()
+            text = "\n".join([
+                f"**Current:** {personality['display_name']}",
+                f"Engine: `{personality.get('model', 'unknown')}`",
+                "",
+                "*Personality switching is disabled in local-only mode.*",
+            ])
+            self._reply = (manager.version, text)
 
-        # In local-only mode, just show current personality
-        await self.bot.send_message(channel_id,
-            f"**Current:** {personality['display_name']}\n"
-            f"Engine: `{personality.get('model', 'unknown')}`\n\n"
-            f"*Personality switching is disabled in local-only mode.*",
-            is_dm=is_dm, author_id=author_id)
+        await self.bot.send_message(channel_id, self._reply[1], is_dm=is_dm, author_id=author_id)
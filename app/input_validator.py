@@ -7,6 +7,7 @@ Prevents injection attacks and ensures data integrity
 import re
 from typing import Optional, Union, List, Tuple
 from datetime import datetime
+from types import MappingProxyType
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,8 @@ class InputValidator:
     MESSAGE_LINK_PATTERN = re.compile(
         r'https?://(?:ptb\.|canary\.)?discord(?:app)?\.com/channels/(\d{17,19})/(\d{17,19})/(\d{17,19})'
     )
+    # Plain message link as !catchup and !birthday scan take it: guild / channel / message IDs
+    DISCORD_LINK_PATTERN = re.compile(r'https://discord\.com/channels/(\d+)/(\d+)/(\d+)')
     
     # Maximum lengths for various inputs
     MAX_COMMAND_LENGTH = 100
@@ -30,7 +33,25 @@ class InputValidator:
     MAX_USERNAME_LENGTH = 32
     
     # Dangerous characters that could be used for injection
-    DANGEROUS_CHARS = re.compile(r'[;&|`$(){}\\]')
+    DANGEROUS_CHARS = ';&|`$(){}\\'
+
+    # Patterns used while sanitizing (compiled once, not per call)
+    URL_PATTERN = re.compile(r'https?://[^\s]+')
+    COMMAND_NAME_STRIP = re.compile(r'[^a-zA-Z0-9_]')
+    CHANNEL_NAME_SEPARATORS = re.compile(r'[^a-z0-9]+')
+    JSON_KEY_STRIP = re.compile(r'[^a-zA-Z0-9_-]')
+
+    # One str.translate delete table for sanitize_string: the null byte, C0
+    # control characters except \t and \n, and the dangerous characters
+    SANITIZE_DELETE = dict.fromkeys(i for i in range(32) if i not in (9, 10))
+    SANITIZE_DELETE.update(dict.fromkeys(map(ord, DANGEROUS_CHARS)))
+
+    # str.translate delete tables for the remaining plain character sets
+    FOCUS_DELETE = dict.fromkeys(map(ord, '<>{}\\'))
+    USERNAME_DELETE = dict.fromkeys(map(ord, '@#:`'))
+
+    # Discord markdown characters and their escaped forms
+    MARKDOWN_ESCAPES = str.maketrans({c: '\\' + c for c in '*_~`|>#'})
     
     @staticmethod
     def sanitize_string(text: str, max_length: int = 2000, 
@@ -51,21 +72,12 @@ class InputValidator:
         if not text:
             return ""
         
-        # Truncate to max length
-        text = text[:max_length]
-
         # Note: HTML escaping removed - Discord doesn't render HTML
         # and it was causing apostrophes to become &#x27; in output
 
-        # Remove null bytes
-        text = text.replace('\x00', '')
-        
-        # Remove control characters except newlines and tabs
-        text = ''.join(char for char in text 
-                      if char == '\n' or char == '\t' or not ord(char) < 32)
-        
-        # Remove dangerous shell characters
-        text = InputValidator.DANGEROUS_CHARS.sub('', text)
+        # Truncate to max length, then remove null bytes, control characters
+        # (except newlines and tabs) and dangerous shell characters in one pass
+        text = text[:max_length].translate(InputValidator.SANITIZE_DELETE)
         
         # Handle mentions
         if not allow_mentions:
@@ -73,7 +85,7 @@ class InputValidator:
         
         # Handle URLs
         if not allow_urls:
-            text = re.sub(r'https?://[^\s]+', '[URL REMOVED]', text)
+            text = InputValidator.URL_PATTERN.sub('[URL REMOVED]', text)
         
         return text.strip()
     
@@ -88,6 +100,10 @@ class InputValidator:
         if not user_id:
             return False, None
         
+        # Fast path for the common case: a plain numeric ID
+        if 17 <= len(user_id) <= 19 and user_id.isdecimal():
+            return True, user_id
+        
         # Check if it's a mention
         mention_match = InputValidator.DISCORD_MENTION_PATTERN.match(user_id)
         if mention_match:
@@ -176,7 +192,7 @@ class InputValidator:
         # Only allow alphanumeric, spaces, and underscores in command name
         command_parts = command.split(maxsplit=1)
         if command_parts:
-            command_name = re.sub(r'[^a-zA-Z0-9_]', '', command_parts[0])
+            command_name = InputValidator.COMMAND_NAME_STRIP.sub('', command_parts[0])
             if len(command_parts) > 1:
                 command = f"{command_name} {command_parts[1]}"
             else:
@@ -203,7 +219,7 @@ class InputValidator:
         )
         
         # Remove any remaining special characters that could affect prompts
-        focus = re.sub(r'[<>{}\\]', '', focus)
+        focus = focus.translate(InputValidator.FOCUS_DELETE)
         
         return bool(focus), focus
     
@@ -221,7 +237,7 @@ class InputValidator:
         )
         
         # Discord usernames can't have certain characters
-        username = re.sub(r'[@#:`]', '', username)
+        username = username.translate(InputValidator.USERNAME_DELETE)
         
         return username or "Unknown User"
     
@@ -240,8 +256,8 @@ class InputValidator:
         
         # Discord channel names are lowercase with hyphens
         channel_name = channel_name.lower()
-        channel_name = re.sub(r'[^a-z0-9-]', '-', channel_name)
-        channel_name = re.sub(r'-+', '-', channel_name)
+        # Each run of other characters and hyphens becomes a single hyphen
+        channel_name = InputValidator.CHANNEL_NAME_SEPARATORS.sub('-', channel_name)
         
         return channel_name.strip('-') or "unknown-channel"
     
@@ -257,7 +273,7 @@ class InputValidator:
             return False, ""
         
         # Only allow alphanumeric, underscores, and hyphens
-        key = re.sub(r'[^a-zA-Z0-9_-]', '', key)
+        key = InputValidator.JSON_KEY_STRIP.sub('', key)
         
         # Limit length
         key = key[:100]
@@ -271,27 +287,26 @@ class InputValidator:
             return ""
         
         # Escape Discord markdown
-        markdown_chars = ['*', '_', '~', '`', '|', '>', '#']
-        for char in markdown_chars:
-            text = text.replace(char, f'\\{char}')
-        
-        return text
+        return text.translate(InputValidator.MARKDOWN_ESCAPES)
 
 
 class RateLimitValidator:
     """Validates rate limiting for various operations"""
     
-    def __init__(self):
-        self.command_limits = {
-            'catchup': (5, 300),  # 5 uses per 5 minutes
-            'birthday': (10, 60),  # 10 uses per minute
-            'admin': (20, 60),  # 20 uses per minute
-            'perspectives': (10, 60),  # 10 uses per minute
-        }
+    __slots__ = ()
+
+    # Limits never change at runtime, so one read-only table serves every instance
+    command_limits = MappingProxyType({
+        'catchup': (5, 300),  # 5 uses per 5 minutes
+        'birthday': (10, 60),  # 10 uses per minute
+        'admin': (20, 60),  # 20 uses per minute
+        'perspectives': (10, 60),  # 10 uses per minute
+    })
+    DEFAULT_LIMIT = (30, 60)  # 30 uses per minute
     
     def get_limit(self, command: str) -> Tuple[int, int]:
         """Get rate limit for a command (uses, seconds)"""
-        return self.command_limits.get(command, (30, 60))  # Default: 30/minute
+        return self.command_limits.get(command, self.DEFAULT_LIMIT)
 
 
 # Singleton instances
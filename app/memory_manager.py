@@ -4,7 +4,6 @@ Persistent Memory Manager for Seedkeeper
 Provides forever-lasting user conversation memory with explicit control
 """
 
-import json
 import os
 from pathlib import Path
 from typing import List, Dict, Optional, Any
@@ -12,7 +11,8 @@ from datetime import datetime, timedelta
 import asyncio
 from dataclasses import dataclass, asdict
 import hashlib
-from persistence import atomic_json_write
+import heapq
+from persistence import atomic_json_write, json_dumps, json_loads, read_json
 from input_validator import InputValidator
 
 @dataclass
@@ -60,8 +60,7 @@ class MemoryManager:
         """Load memory settings (which users have opted in/out)"""
         if self.settings_file.exists():
             try:
-                with open(self.settings_file, 'r') as f:
-                    return json.load(f)
+                return read_json(self.settings_file)
             except:
                 return self.get_default_settings()
         return self.get_default_settings()
@@ -106,16 +105,19 @@ class MemoryManager:
 
     def disable_memory(self, user_id: str, keep_existing: bool = True):
         """Disable memory for a user"""
+        now = datetime.utcnow().isoformat()
         self.settings["enabled_users"][user_id] = {
             "enabled": False,
-            "disabled_at": datetime.utcnow().isoformat(),
+            "disabled_at": now,
             "keep_existing": keep_existing
         }
-        self.save_settings()
 
         if not keep_existing:
-            # Clear all memories for this user
-            self.clear_user_memory(user_id)
+            # Clear all memories for this user; recorded in the same settings write
+            self._drop_user_memories(user_id)
+            self.settings["enabled_users"][user_id]["last_cleared"] = now
+
+        self.save_settings()
 
     def _evict_cache(self):
         """Evict oldest entries if cache exceeds size limit"""
@@ -173,7 +175,7 @@ class MemoryManager:
         # Update in-memory cache (keep recent 20 for quick access)
         cache_key = f"memory:{user_id}"
         recent_memories = memories[-20:]
-        self._cache[cache_key] = json.dumps(recent_memories)
+        self._cache[cache_key] = json_dumps(recent_memories)
         self._evict_cache()
 
         return True
@@ -186,10 +188,9 @@ class MemoryManager:
             return []
 
         try:
-            with open(user_file, 'r') as f:
-                memories = json.load(f)
-                # Only return the tail to avoid loading everything into memory
-                return memories[-limit:] if len(memories) > limit else memories
+            memories = read_json(user_file)
+            # Only return the tail to avoid loading everything into memory
+            return memories[-limit:] if len(memories) > limit else memories
         except:
             return []
 
@@ -199,8 +200,7 @@ class MemoryManager:
 
         if user_file.exists():
             try:
-                with open(user_file, 'r') as f:
-                    return json.load(f)
+                return read_json(user_file)
             except:
                 return []
         return []
@@ -223,7 +223,21 @@ class MemoryManager:
         """
         if not self.is_memory_enabled(user_id):
             return []
+        return self._recent_memories(user_id, limit, channel_type, guild_id, channel_id)
+
+    def get_context_bundle(self, user_id: str, limit: int = 10, channel_type: Optional[str] = None,
+                           guild_id: Optional[str] = None, channel_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get a user's memory setting and recent memories in one call
 
+        Returns {'enabled': bool, 'memories': [...]}; memories is empty when
+        memory is disabled. Filters are the same as get_recent_memories.
+        """
+        enabled = self.is_memory_enabled(user_id)
+        memories = self._recent_memories(user_id, limit, channel_type, guild_id, channel_id) if enabled else []
+        return {'enabled': enabled, 'memories': memories}
+
+    def _recent_memories(self, user_id: str, limit: int, channel_type: Optional[str],
+                         guild_id: Optional[str], channel_id: Optional[str]) -> List[Dict]:
         # Build cache key with context
         cache_key_parts = [f"memory:{user_id}"]
         if channel_type:
@@ -238,7 +252,7 @@ class MemoryManager:
         cached = self._cache.get(cache_key)
 
         if cached:
-            memories = json.loads(cached)
+            memories = json_loads(cached)
             return memories[-limit:]
 
         # Load from disk
@@ -268,7 +282,7 @@ class MemoryManager:
         # Cache recent filtered memories
         if memories:
             recent = memories[-20:]
-            self._cache[cache_key] = json.dumps(recent)
+            self._cache[cache_key] = json_dumps(recent)
             self._evict_cache()
 
         return memories[-limit:]
@@ -287,23 +301,21 @@ class MemoryManager:
         memories = self.load_user_memories(user_id)
 
         # Simple relevance scoring based on keyword matching
-        context_lower = context.lower()
-        context_words = set(context_lower.split())
+        context_words = set(context.lower().split())
+        if not context_words:
+            return []
 
         scored_memories = []
         for memory in memories:
-            content_lower = memory.get("content", "").lower()
-            content_words = set(content_lower.split())
-
             # Score based on word overlap
-            overlap = len(context_words & content_words)
+            overlap = len(context_words.intersection(memory.get("content", "").lower().split()))
             if overlap > 0:
                 scored_memories.append((overlap, memory))
 
-        # Sort by relevance and recency
-        scored_memories.sort(key=lambda x: (x[0], x[1]["timestamp"]), reverse=True)
+        # Top matches by relevance and recency, without sorting every match
+        top = heapq.nlargest(limit, scored_memories, key=lambda x: (x[0], x[1]["timestamp"]))
 
-        return [m[1] for m in scored_memories[:limit]]
+        return [m[1] for m in top]
 
     def summarize_memories(self, user_id: str, older_than_days: int = 30) -> Optional[str]:
         """Create a summary of older memories (for Claude to generate)"""
@@ -312,58 +324,75 @@ class MemoryManager:
         if not memories:
             return None
 
-        cutoff = datetime.utcnow() - timedelta(days=older_than_days)
-        older_memories = [
-            m for m in memories
-            if datetime.fromisoformat(m["timestamp"]) < cutoff
-        ]
+        # Stored timestamps are utcnow().isoformat(), which sort as strings,
+        # so compare against the cutoff's ISO form instead of parsing each one
+        cutoff = (datetime.utcnow() - timedelta(days=older_than_days)).isoformat()
+        older_memories = [m for m in memories if m["timestamp"] < cutoff]
 
         if not older_memories:
             return None
 
         # Format memories for summarization
-        summary_text = "Previous conversations to summarize:\n\n"
+        parts = ["Previous conversations to summarize:\n\n"]
         for memory in older_memories[-20:]:  # Last 20 older memories
             author = "User" if memory["author"] == "user" else "Bot"
-            summary_text += f"[{memory['timestamp']}] {author}: {memory['content']}\n"
+            parts.append(f"[{memory['timestamp']}] {author}: {memory['content']}\n")
 
-        return summary_text
+        return "".join(parts)
 
     def clear_user_memory(self, user_id: str) -> bool:
         """Clear all memories for a user"""
-        # Remove from disk
+        self._drop_user_memories(user_id)
+
+        # Update settings
+        if user_id in self.settings["enabled_users"]:
+            self.settings["enabled_users"][user_id]["last_cleared"] = datetime.utcnow().isoformat()
+            self.save_settings()
+
+        return True
+
+    def _drop_user_memories(self, user_id: str):
+        """Remove a user's memory file and every cache entry for them"""
         user_file = self.get_user_file(user_id)
         if user_file.exists():
             user_file.unlink()
 
-        # Remove from cache
+        # Plain and filtered cache keys, in one pass
         cache_key = f"memory:{user_id}"
-        self._cache.pop(cache_key, None)
-        # Also remove any filtered cache entries for this user
-        keys_to_remove = [k for k in self._cache if k.startswith(f"memory:{user_id}:")]
+        filtered_prefix = cache_key + ":"
+        keys_to_remove = [k for k in self._cache if k == cache_key or k.startswith(filtered_prefix)]
         for key in keys_to_remove:
             del self._cache[key]
 
-        # Update settings
-        if user_id in self.settings["enabled_users"]:
-            self.settings["enabled_users"][user_id]["last_cleared"] = datetime.utcnow().isoformat()
-            self.save_settings()
+    def count_by_channel_type(self, user_id: str) -> Dict[str, int]:
+        """Count a user's stored memories per channel type ('dm' / 'guild')
 
-        return True
+        Like get_recent_memories, nothing is counted while memory is disabled.
+        """
+        counts: Dict[str, int] = {}
+        if not self.is_memory_enabled(user_id):
+            return counts
+        for memory in self.load_user_memories(user_id):
+            channel_type = memory.get("channel_type")
+            counts[channel_type] = counts.get(channel_type, 0) + 1
+        return counts
 
     def get_memory_stats(self, user_id: str) -> Dict[str, Any]:
         """Get memory statistics for a user"""
         memories = self.load_user_memories(user_id)
         user_settings = self.settings["enabled_users"].get(user_id, {})
+        enabled = user_settings.get("enabled", True)
+        max_memories = user_settings.get("max_memories", self.settings["default_max_memories"])
+        auto_summarize = user_settings.get("auto_summarize", self.settings["default_auto_summarize"])
 
         if not memories:
             return {
-                "enabled": self.is_memory_enabled(user_id),
+                "enabled": enabled,
                 "total_memories": 0,
                 "oldest_memory": None,
                 "newest_memory": None,
-                "max_memories": user_settings.get("max_memories", self.settings["default_max_memories"]),
-                "auto_summarize": user_settings.get("auto_summarize", self.settings["default_auto_summarize"])
+                "max_memories": max_memories,
+                "auto_summarize": auto_summarize
             }
 
         oldest = memories[0]["timestamp"]
@@ -374,16 +403,25 @@ class MemoryManager:
         newest_dt = datetime.fromisoformat(newest)
         days_span = (newest_dt - oldest_dt).days
 
+        # Count both channel types in one pass over the loaded list
+        dm_count = guild_count = 0
+        for memory in memories:
+            channel_type = memory.get("channel_type")
+            if channel_type == "dm":
+                dm_count += 1
+            elif channel_type == "guild":
+                guild_count += 1
+
         return {
-            "enabled": self.is_memory_enabled(user_id),
+            "enabled": enabled,
             "total_memories": len(memories),
             "oldest_memory": oldest,
             "newest_memory": newest,
             "days_of_history": days_span,
-            "max_memories": user_settings.get("max_memories", self.settings["default_max_memories"]),
-            "auto_summarize": user_settings.get("auto_summarize", self.settings["default_auto_summarize"]),
-            "dm_memories": sum(1 for m in memories if m.get("channel_type") == "dm"),
-            "guild_memories": sum(1 for m in memories if m.get("channel_type") == "guild")
+            "max_memories": max_memories,
+            "auto_summarize": auto_summarize,
+            "dm_memories": dm_count,
+            "guild_memories": guild_count
         }
 
     def _warm_cache(self):
@@ -400,7 +438,7 @@ class MemoryManager:
                     recent = memories[-20:]
                     cache_key = f"memory:{user_id}"
                     try:
-                        self._cache[cache_key] = json.dumps(recent)
+                        self._cache[cache_key] = json_dumps(recent)
                     except Exception as e:
                         print(f"Could not cache memories for user {user_id}: {e}")
 
@@ -415,40 +453,43 @@ class MemoryManager:
             return None
 
         if format == "json":
-            return json.dumps(memories, indent=2)
+            return json_dumps(memories, indent=2)
 
         elif format == "text":
-            output = f"Memory Export for User {user_id}\n"
-            output += f"{'='*50}\n\n"
+            # Collect pieces and join once rather than re-copying a growing string
+            parts = [f"Memory Export for User {user_id}\n", f"{'='*50}\n\n"]
 
             for memory in memories:
                 timestamp = memory["timestamp"]
                 author = "You" if memory["author"] == "user" else "Seedkeeper"
                 content = memory["content"]
-                output += f"[{timestamp}] {author}:\n{content}\n\n"
+                parts.append(f"[{timestamp}] {author}:\n{content}\n\n")
 
-            return output
+            return "".join(parts)
 
         elif format == "markdown":
-            output = f"# Memory Export\n\n"
-            output += f"**User ID:** {user_id}\n"
-            output += f"**Total Memories:** {len(memories)}\n\n"
+            parts = [
+                f"# Memory Export\n\n",
+                f"**User ID:** {user_id}\n",
+                f"**Total Memories:** {len(memories)}\n\n",
+            ]
 
             current_date = None
             for memory in memories:
-                timestamp = datetime.fromisoformat(memory["timestamp"])
-                date_str = timestamp.strftime("%Y-%m-%d")
+                # Date and time are fixed slices of the stored ISO timestamp
+                timestamp = memory["timestamp"]
+                date_str = timestamp[:10]
 
                 if date_str != current_date:
-                    output += f"\n## {date_str}\n\n"
+                    parts.append(f"\n## {date_str}\n\n")
                     current_date = date_str
 
-                time_str = timestamp.strftime("%H:%M:%S")
+                time_str = timestamp[11:19]
                 author = "You" if memory["author"] == "user" else "Seedkeeper"
                 content = memory["content"]
 
-                output += f"**[{time_str}] {author}:**\n> {content}\n\n"
+                parts.append(f"**[{time_str}] {author}:**\n> {content}\n\n")
 
-            return output
+            return "".join(parts)
 
         return None
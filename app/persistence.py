@@ -2,17 +2,70 @@
 """
 Atomic JSON write utility for Seedkeeper.
 Uses tmp+rename to prevent data corruption on crash.
+
+orjson is used for (de)serialization when installed; stdlib json otherwise.
 """
 
 import json
 import os
 from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _orjson_options(kwargs) -> Optional[int]:
+    """orjson option flags matching these json.dump kwargs, or None if orjson can't honour them."""
+    if orjson is None or not set(kwargs) <= {'indent', 'default'}:
+        return None
+    indent = kwargs.get('indent')
+    if indent not in (None, 2):
+        return None
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if kwargs.get('default') is not None:
+        # Let the caller's default see datetimes, as json.dump would
+        option |= orjson.OPT_PASSTHROUGH_DATETIME
+    return option
 
 
 def atomic_json_write(path, data, **kwargs):
     """Write JSON atomically using tmp file + os.replace()."""
     path = str(path)
     tmp = path + '.tmp'
-    with open(tmp, 'w') as f:
-        json.dump(data, f, **kwargs)
+    option = _orjson_options(kwargs)
+    if option is not None:
+        with open(tmp, 'wb') as f:
+            f.write(orjson.dumps(data, default=kwargs.get('default'), option=option))
+    else:
+        with open(tmp, 'w') as f:
+            json.dump(data, f, **kwargs)
     os.replace(tmp, path)
+
+
+def read_json(path):
+    """Load a JSON file."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def json_dumps(data, indent: Optional[int] = None) -> str:
+    """JSON string; compact by default (in-memory caches), indent=2 for exports."""
+    option = _orjson_options({'indent': indent})
+    if option is not None:
+        return orjson.dumps(data, option=option).decode('utf-8')
+    return json.dumps(data, indent=indent)
+
+
+def json_loads(text):
+    """Parse a JSON string or bytes."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
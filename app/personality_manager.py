@@ -43,6 +43,8 @@ class PersonalityManager:
         os.makedirs(data_dir, exist_ok=True)
         self._personalities = self._load_personalities()
         self._user_prefs = self._load_user_prefs()
+        self._default = None  # resolved default personality, cleared on reload
+        self.version = 0  # bumped when personalities are reloaded
 
     def _load_personalities(self) -> Dict[str, dict]:
         if os.path.exists(self._personalities_path):
@@ -99,7 +101,12 @@ class PersonalityManager:
         return list(self._personalities.values())
 
     def get_default(self) -> dict:
-        """Return the default personality."""
+        """Return the default personality (resolved once, until reload)."""
+        if self._default is None:
+            self._default = self._resolve_default()
+        return self._default
+
+    def _resolve_default(self) -> dict:
         for p in self._personalities.values():
             if p.get('is_default'):
                 return p
@@ -113,3 +120,5 @@ class PersonalityManager:
         """Reload personalities from disk."""
         self._personalities = self._load_personalities()
         self._user_prefs = self._load_user_prefs()
+        self._default = None
+        self.version += 1
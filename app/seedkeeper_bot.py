@@ -6,14 +6,16 @@ No Redis, no external APIs - just pure bot love
 """
 
 import asyncio
+import aiohttp
 import discord
 from discord.ext import commands
 import os
 import sys
 import time
 import random
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, Iterator, List
 from dotenv import load_dotenv
 
 # Add current directory to path
@@ -31,6 +33,7 @@ from feedback_manager import FeedbackManager
 from personality_manager import PersonalityManager
 from model_client import ModelClient
 from rate_limiter import RateLimiter
+from config import DM_CHANNEL_CACHE_SIZE
 from commands import COMMANDS, resolve_command, generate_commands_reference
 from handlers import (
     GardenHandler, ConversationHandler, CatchupHandler,
@@ -49,6 +52,13 @@ if not DISCORD_TOKEN:
     print("DISCORD_BOT_TOKEN not set in environment")
     exit(1)
 
+BIRTHDAY_POEM_PROMPT = """You are a warm, loving poet crafting birthday messages for a close-knit community called The Garden Cafe.
+Write heartfelt, unique birthday poems that feel personal and special.
+Keep poems 4-8 lines. Be creative, warm, and celebratory.
+You may reference their zodiac traits poetically but keep it light and fun.
+Do not use generic phrases like "wishing you the best" - make it memorable and unique.
+Output ONLY the poem, no introduction or explanation."""
+
 
 class SeedkeeperBot(commands.Bot):
     """Unified Seedkeeper bot - single-process Discord connection with local Ollama API"""
@@ -86,8 +96,11 @@ class SeedkeeperBot(commands.Bot):
             self.admin_manager.add_admin(BOT_OWNER_ID)
 
         # In-memory state (replaces Redis)
-        self._dm_conversations = {}  # author_id -> list of messages
+        self._dm_conversations = {}  # author_id -> deque of recent messages (bounded)
+        self._dm_summaries = {}      # author_id -> running summary of older DM turns
         self._temp_state = {}        # key -> (value, expiry_timestamp)
+        self._send_locks = {}  # channel id -> [ordering lock, senders using it]; dropped when idle
+        self._dm_channels = OrderedDict()  # author_id -> DMChannel (LRU, capped)
 
         # Track startup time
         self._started_at = time.time()
@@ -288,13 +301,6 @@ class SeedkeeperBot(commands.Bot):
                 zodiac_context += f" In Chinese astrology, they are a {chinese['element']} {chinese['animal']} "
                 zodiac_context += f"({chinese['yin_yang']}), known for: {chinese['traits']}."
 
-            system_prompt = """You are a warm, loving poet crafting birthday messages for a close-knit community called The Garden Cafe.
-Write heartfelt, unique birthday poems that feel personal and special.
-Keep poems 4-8 lines. Be creative, warm, and celebratory.
-You may reference their zodiac traits poetically but keep it light and fun.
-Do not use generic phrases like "wishing you the best" - make it memorable and unique.
-Output ONLY the poem, no introduction or explanation."""
-
             messages = [{
                 "role": "user",
                 "content": f"Write a unique, heartfelt birthday poem for {name}.\n\nAbout them: {zodiac_context}\n\nMake it warm, personal, and celebratory. 4-8 lines."
@@ -302,7 +308,7 @@ Output ONLY the poem, no introduction or explanation."""
 
             result = await self.model_client.complete(
                 personality=personality,
-                system=system_prompt,
+                system=BIRTHDAY_POEM_PROMPT,
                 messages=messages,
                 max_tokens=300,
                 temperature=1.0,
@@ -363,6 +369,22 @@ Output ONLY the poem, no introduction or explanation."""
 
     # ── Discord events ───────────────────────────────────────────
 
+    async def setup_hook(self):
+        """Create shared resources once the event loop is running"""
+        # Shared HTTP session for side calls to the model server (e.g. !health);
+        # a small keep-alive pool so repeat calls reuse a warm connection
+        self.http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=5),
+        )
+
+    async def close(self):
+        """Release shared resources, then disconnect"""
+        session = getattr(self, 'http_session', None)
+        if session and not session.closed:
+            await session.close()
+        await super().close()
+
     async def on_ready(self):
         """Called when bot connects to Discord"""
         print(f'Seedkeeper Online: {self.user}')
@@ -374,7 +396,6 @@ Output ONLY the poem, no introduction or explanation."""
             print(f'  - Guild: {guild.name} (ID: {guild.id})')
             # Pre-populate member cache for birthday matching
             try:
-                import asyncio
                 await asyncio.wait_for(guild.chunk(), timeout=30.0)
                 print(f'    Cached {len(guild.members)} members')
             except asyncio.TimeoutError:
@@ -467,7 +488,7 @@ Output ONLY the poem, no introduction or explanation."""
 
         # Handle DM conversations
         if is_dm and not content.startswith('!'):
-            await self._conversation.handle_dm_conversation(command_data)
+            await self._conversation.enqueue_dm_conversation(command_data)
             return
 
         # Handle mentions
@@ -476,82 +497,144 @@ Output ONLY the poem, no introduction or explanation."""
 
     # ── Message utilities ────────────────────────────────────────
 
-    def split_message(self, content: str, max_length: int = 1900) -> List[str]:
-        """Split long messages into chunks"""
-        if len(content) <= max_length:
-            return [content]
-
-        chunks = []
-        current = ""
-
-        for line in content.split('\n'):
-            if len(current) + len(line) + 1 > max_length:
-                if current:
-                    chunks.append(current)
-                current = line
-            else:
-                if current:
-                    current += '\n' + line
-                else:
-                    current = line
-
+    def iter_message_chunks(self, content: str, max_length: int = 1900) -> Iterator[str]:
+        """Yield chunks of a long message, breaking on newlines where possible"""
+        start = 0
+        end = len(content)
+        while end - start > max_length:
+            cut = content.rfind('\n', start, start + max_length + 1)
+            if cut == -1:
+                # No newline in range - hard split
+                yield content[start:start + max_length]
+                start += max_length
+                continue
+            if cut > start:
+                yield content[start:cut]
+            start = cut + 1
+        if start < end:
+            yield content[start:]
+
+    def pack_blocks(self, blocks: List[str], max_length: int = 1900, sep: str = '\n') -> List[str]:
+        """Join text blocks into messages, breaking only between blocks"""
+        pages = []
+        current = []
+        current_len = 0
+        for block in blocks:
+            added = len(block) + (len(sep) if current else 0)
+            if current and current_len + added > max_length:
+                pages.append(sep.join(current))
+                current = []
+                current_len = 0
+                added = len(block)
+            current.append(block)
+            current_len += added
         if current:
-            chunks.append(current)
-
-        return chunks
-
-    async def send_message(self, channel_id: str, content: str, is_dm: bool = False,
-                          author_id: Optional[str] = None, embed=None):
-        """Send message directly to Discord channel"""
+            pages.append(sep.join(current))
+        return pages
+
+    def forget_dm_session(self, author_id: str):
+        """Drop a user's in-memory DM history and running summary"""
+        key = str(author_id)
+        self._dm_conversations.pop(key, None)
+        self._dm_summaries.pop(key, None)
+
+    async def get_dm_channel(self, author_id: str):
+        """Return the DM channel for a user, resolving it only on first use"""
+        key = str(author_id)
+        channel = self._dm_channels.get(key)
+        if channel is not None:
+            self._dm_channels.move_to_end(key)
+            return channel
+
+        user_id = int(key)
+        user = self.get_user(user_id) or await self.fetch_user(user_id)
+        channel = user.dm_channel or await user.create_dm()
+        self._dm_channels[key] = channel
+        if len(self._dm_channels) > DM_CHANNEL_CACHE_SIZE:
+            self._dm_channels.popitem(last=False)
+        return channel
+
+    async def _resolve_channel(self, channel_id: str, is_dm: bool = False,
+                               author_id: Optional[str] = None):
+        """Resolve the channel to send to (the author's DM channel for DMs)"""
         channel = None
         if is_dm and author_id:
             try:
-                user = self.get_user(int(author_id)) or await self.fetch_user(int(author_id))
-                channel = user.dm_channel or await user.create_dm()
+                channel = await self.get_dm_channel(author_id)
             except Exception as e:
                 print(f"Error getting DM channel: {e}")
-                return
+                return None
         else:
             try:
                 channel = self.get_channel(int(channel_id))
             except Exception as e:
                 print(f"Error getting channel: {e}")
-                return
+                return None
 
         if not channel:
             print(f"Could not find channel {channel_id}")
+        return channel
+
+    async def send_message(self, channel_id: str, content: str, is_dm: bool = False,
+                          author_id: Optional[str] = None, embed=None):
+        """Send message directly to Discord channel"""
+        channel = await self._resolve_channel(channel_id, is_dm=is_dm, author_id=author_id)
+        if not channel:
             return
 
-        # Auto-split long messages
+        if isinstance(embed, dict):
+            embed = discord.Embed.from_dict(embed)
+
+        # Auto-split long messages, sending chunks as they are cut; discord.py's
+        # rate limiter paces the sends, as in send_chunks
         if len(content) > 1900:
-            chunks = self.split_message(content, 1900)
-            for i, chunk in enumerate(chunks):
+            for i, chunk in enumerate(self.iter_message_chunks(content, 1900)):
                 kwargs = {'content': chunk}
                 if embed and i == 0:
-                    if isinstance(embed, dict):
-                        kwargs['embed'] = discord.Embed.from_dict(embed)
-                    else:
-                        kwargs['embed'] = embed
+                    kwargs['embed'] = embed
                 await channel.send(**kwargs)
-                if i < len(chunks) - 1:
-                    await asyncio.sleep(0.5)
         else:
             kwargs = {'content': content}
             if embed:
-                if isinstance(embed, dict):
-                    kwargs['embed'] = discord.Embed.from_dict(embed)
-                else:
-                    kwargs['embed'] = embed
+                kwargs['embed'] = embed
             await channel.send(**kwargs)
 
+    async def send_chunks(self, channel_id: str, chunks: Iterable[str], is_dm: bool = False,
+                          author_id: Optional[str] = None):
+        """Send a multi-part reply in order, resolving the channel once.
+
+        A per-channel lock keeps the parts of concurrent replies from
+        interleaving; discord.py's rate limiter paces the sends.
+        """
+        channel = await self._resolve_channel(channel_id, is_dm=is_dm, author_id=author_id)
+        if not channel:
+            return
+
+        entry = self._send_locks.get(channel.id)
+        if entry is None:
+            entry = self._send_locks[channel.id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                for chunk in chunks:
+                    if not chunk:
+                        continue
+                    parts = self.iter_message_chunks(chunk, 1900) if len(chunk) > 1900 else (chunk,)
+                    for part in parts:
+                        await channel.send(content=part)
+        finally:
+            # Last sender out removes the lock, so idle channels don't accumulate
+            entry[1] -= 1
+            if not entry[1]:
+                del self._send_locks[channel.id]
+
     async def send_typing(self, channel_id: str, is_dm: bool = False,
                          author_id: Optional[str] = None, duration: int = 3):
         """Show typing indicator"""
         channel = None
         if is_dm and author_id:
             try:
-                user = self.get_user(int(author_id)) or await self.fetch_user(int(author_id))
-                channel = user.dm_channel or await user.create_dm()
+                channel = await self.get_dm_channel(author_id)
             except:
                 pass
         else:
@@ -11,8 +11,11 @@ import json
 import os
 import threading
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Dict, Any, Optional
 
+from persistence import atomic_json_write, read_json
+
 
 def _empty_bucket() -> Dict[str, Any]:
     return {"calls": 0, "input_tokens": 0, "output_tokens": 0, "cost": 0.0}
@@ -26,24 +29,22 @@ class UsageTracker:
         self._path = os.path.join(data_dir, "usage_stats.json")
         os.makedirs(data_dir, exist_ok=True)
         self._data = self._load()
+        self._version = 0  # bumped on every write
+        self._sorted_cache: Dict[str, Any] = {}  # name -> (version, rows)
 
     # ── persistence ──────────────────────────────────────────────
 
     def _load(self) -> Dict[str, Any]:
         if os.path.exists(self._path):
             try:
-                with open(self._path, "r") as f:
-                    return json.load(f)
+                return read_json(self._path)
             except (json.JSONDecodeError, IOError) as e:
                 print(f"[UsageTracker] Error loading {self._path}: {e}")
         return self._default_data()
 
     def _save(self):
         try:
-            tmp = self._path + ".tmp"
-            with open(tmp, "w") as f:
-                json.dump(self._data, f, indent=2)
-            os.replace(tmp, self._path)
+            atomic_json_write(self._path, self._data, indent=2)
         except IOError as e:
             print(f"[UsageTracker] Error saving: {e}")
 
@@ -141,6 +142,8 @@ class UsageTracker:
             # prune old daily entries
             self._prune_daily(d, 90)
 
+            self._version += 1
+
             self._save()
 
     # ── pruning ──────────────────────────────────────────────────
@@ -165,10 +168,11 @@ class UsageTracker:
             }
 
     def get_daily_trend(self, days: int = 7) -> list:
+        now = datetime.utcnow()
         with self._lock:
             result = []
             for i in range(days - 1, -1, -1):
-                date = (datetime.utcnow() - timedelta(days=i)).strftime("%Y-%m-%d")
+                date = (now - timedelta(days=i)).strftime("%Y-%m-%d")
                 day = self._data["daily"].get(date, _empty_bucket())
                 result.append({"date": date, **day})
             return result
@@ -189,6 +193,14 @@ class UsageTracker:
             totals["period_days"] = days
             return totals
 
+    def get_all_stats(self) -> Dict[str, Any]:
+        """Get the today / 7-day / 30-day views used by the insights dashboard."""
+        return {
+            "today": self.get_today_summary(),
+            "daily_trend": self.get_daily_trend(7),
+            "rolling_30d": self.get_rolling_summary(30),
+        }
+
     def get_model_breakdown(self) -> Dict[str, Any]:
         with self._lock:
             return dict(self._data.get("models", {}))
@@ -197,8 +209,33 @@ class UsageTracker:
         with self._lock:
             return dict(self._data.get("commands", {}))
 
+    def _sorted_rows(self, section: str, sort_field: str) -> list:
+        """(name, calls, cost) rows for a section, highest sort_field first.
+
+        Caller holds the lock. Rows are re-sorted only after a new write.
+        """
+        key = f"{section}:{sort_field}"
+        cached = self._sorted_cache.get(key)
+        if cached and cached[0] == self._version:
+            return cached[1]
+        rows = [(name, stats.get("calls", 0), stats.get("cost", 0), stats.get(sort_field, 0))
+                for name, stats in self._data.get(section, {}).items()]
+        rows.sort(key=itemgetter(3), reverse=True)
+        rows = [row[:3] for row in rows]
+        self._sorted_cache[key] = (self._version, rows)
+        return rows
+
+    def get_model_breakdown_sorted(self) -> list:
+        """Models as (name, calls, cost), most expensive first."""
+        with self._lock:
+            return list(self._sorted_rows("models", "cost"))
+
+    def get_command_breakdown_sorted(self) -> list:
+        """Commands as (name, calls, cost), most expensive first."""
+        with self._lock:
+            return list(self._sorted_rows("commands", "cost"))
+
     def get_user_breakdown(self, top_n: int = 10) -> list:
+        """Top users as (user_id, calls, cost), most calls first."""
         with self._lock:
-            users = self._data.get("users", {})
-            sorted_users = sorted(users.items(), key=lambda x: x[1].get("calls", 0), reverse=True)
-            return sorted_users[:top_n]
+            return self._sorted_rows("users", "calls")[:top_n]
@@ -36,6 +36,7 @@ class ViewsManager:
         self.perspectives = {}
         self.core_perspectives = []
         self.regular_perspectives = []
+        self._prepared = None  # (display_name, source_url, content) tuples, built on demand
 
     def download_views(self) -> Dict:
         """Download the latest views.txt from Lightward"""
@@ -84,6 +85,7 @@ class ViewsManager:
         self.perspectives = {}
         self.core_perspectives = []
         self.regular_perspectives = []
+        self._prepared = None
 
         # Parse each perspective using regex
         pattern = r'<file name="([^"]+)">(.*?)</file>'
@@ -125,6 +127,26 @@ class ViewsManager:
         # Return core first, then regular
         return self.core_perspectives + self.regular_perspectives
 
+    def get_all_perspectives_prepared(self) -> Tuple[Tuple[str, str, str], ...]:
+        """Get all perspectives as ready-to-share (display_name, source_url, content) tuples.
+
+        Built once per parse; content is truncated to 2000 chars.
+        """
+        if not self._prepared:  # an empty result is rebuilt next time
+            prepared = []
+            for name, content in self.get_all_perspectives():
+                # e.g. "3-perspectives/2x2" -> "lightward.com/2x2"
+                url_slug = name.replace('3-perspectives/', '').replace('2-watch-this/', '')
+                if len(content) > 2000:
+                    content = content[:2000] + "..."
+                prepared.append((
+                    url_slug.replace('-', ' ').title(),
+                    f"https://lightward.com/{url_slug}",
+                    content,
+                ))
+            self._prepared = tuple(prepared)
+        return self._prepared
+
     def get_perspective(self, name: str) -> str:
         """Get a specific perspective by name"""
         if not self.perspectives: